@@ -13,6 +13,7 @@ from typing import Any, Dict, Optional
 import openai
 
 from config import settings
+from question_catalog import rubric_levels
 from reliability_expert import EXPERT_SYSTEM, FRAMEWORK_BRIEF, evidence_examples_for
 
 logger = logging.getLogger(__name__)
@@ -255,10 +256,13 @@ Format your response EXACTLY as JSON:
     def _format_rubric(rubric: Optional[Dict]) -> str:
         if not rubric:
             return ""
-        try:
-            items = sorted(rubric.items(), key=lambda kv: float(kv[0]))
-        except Exception:
-            items = list(rubric.items())
+        items = rubric_levels(rubric)
+        if len(items) != len(rubric):
+            # Keys like "1.5" or "notes": keep every entry in the prompt.
+            try:
+                items = sorted(rubric.items(), key=lambda kv: float(kv[0]))
+            except (TypeError, ValueError):
+                items = list(rubric.items())
         lines = [f"{level}: {desc}" for level, desc in items]
         return "\n**Scoring rubric:**\n" + "\n".join(lines)
 
@@ -0,0 +1,37 @@
+"""add reports.content_hash (content-keyed report reuse)
+
+Revision ID: a6b7c8d9e0f1
+Revises: b2d3f4a5c6e7
+Create Date: 2026-10-15 09:00:00.000000
+
+Stores a fingerprint of each generated report's inputs so an unchanged
+assessment can reuse its last PDF. Added only if missing (idempotent), because
+migrate.py stamps create_all-built databases that may already have it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a6b7c8d9e0f1"
+down_revision: Union[str, Sequence[str], None] = "b2d3f4a5c6e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    insp = sa.inspect(op.get_bind())
+    if "reports" not in insp.get_table_names():
+        return
+    cols = {c["name"] for c in insp.get_columns("reports")}
+    if "content_hash" not in cols:
+        op.add_column("reports", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    insp = sa.inspect(op.get_bind())
+    if "reports" in insp.get_table_names():
+        cols = {c["name"] for c in insp.get_columns("reports")}
+        if "content_hash" in cols:
+            op.drop_column("reports", "content_hash")
@@ -0,0 +1,42 @@
+"""responses_v2 (assessment_id, is_draft, is_na) index
+
+Revision ID: b7c8d9e0f1a2
+Revises: a6b7c8d9e0f1
+Create Date: 2026-10-15 12:00:00.000000
+
+Every scoring pass, the confidence counts and both report builders select an
+assessment's submitted answers with ``is_draft = false AND is_na = false``.
+The single-column assessment_id index finds the assessment's rows but then
+has to visit each one to test the flags; the composite index answers the
+whole predicate. Created only if missing (idempotent), because migrate.py
+stamps create_all-built databases that may already have it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "b7c8d9e0f1a2"
+down_revision: Union[str, Sequence[str], None] = "a6b7c8d9e0f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_responses_v2_scoreable"
+
+
+def _has_index(insp) -> bool:
+    return INDEX in {ix["name"] for ix in insp.get_indexes("responses_v2")}
+
+
+def upgrade() -> None:
+    insp = sa.inspect(op.get_bind())
+    if "responses_v2" not in insp.get_table_names() or _has_index(insp):
+        return
+    op.create_index(INDEX, "responses_v2", ["assessment_id", "is_draft", "is_na"], unique=False)
+
+
+def downgrade() -> None:
+    insp = sa.inspect(op.get_bind())
+    if "responses_v2" in insp.get_table_names() and _has_index(insp):
+        op.drop_index(INDEX, table_name="responses_v2")
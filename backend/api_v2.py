@@ -7,7 +7,7 @@ import logging
 import os
 import tempfile
 from datetime import datetime, date
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
 
 from fastapi import (
@@ -35,6 +35,7 @@ from scoring_engine_v2 import ScoringEngineV2
 from routing_engine import RoutingEngine
 from benchmarking_engine import BenchmarkingEngine
 from practice_engine import PracticeEngine
+from question_bank_v2 import preload_question_bank
 from security_utils import (
     save_upload,
     assessment_upload_subdir,
@@ -166,7 +167,9 @@ def create_assessment(data: AssessmentCreate, db: Session = Depends(get_db), cur
         site_name=data.site_name,
         assessment_mode=mode,
         industry_module=industry,
-        assessment_date=assess_date,
+        # DateTime column: store midnight so the reply built below matches
+        # what a later GET reads back.
+        assessment_date=datetime.combine(assess_date, datetime.min.time()),
         region=(data.region or None),
         employee_count=data.employee_count,
         lead_assessor=(data.lead_assessor or None),
@@ -174,10 +177,12 @@ def create_assessment(data: AssessmentCreate, db: Session = Depends(get_db), cur
         creator_id=current_user.id,
     )
     db.add(assessment)
+    # flush() assigns the id; the reply is built before commit() expires the
+    # instance, so no refresh SELECT is needed (same as submit_response).
+    db.flush()
+    result = _format_assessment(assessment)
     db.commit()
-    db.refresh(assessment)
-
-    return _format_assessment(assessment)
+    return result
 
 
 @router.get("/assessments")
@@ -342,13 +347,36 @@ def get_responses(assessment_id: int, db: Session = Depends(get_db), current_use
     ]
 
 
-def _upsert_response(db: Session, assessment_id: int, data: QuestionResponseCreate) -> ResponseV2:
+_ResponseKey = Tuple[int, Optional[TargetRoleV2]]
+
+
+def _existing_responses(db: Session, assessment_id: int,
+                        question_ids: List[int]) -> Dict[_ResponseKey, ResponseV2]:
+    """A batch's already-saved responses in one query, keyed like uq_response_v2."""
+    rows = db.query(ResponseV2).filter(
+        ResponseV2.assessment_id == assessment_id,
+        ResponseV2.question_id.in_(set(question_ids)),
+    )
+    return {(r.question_id, r.respondent_role): r for r in rows}
+
+
+def _upsert_response(db: Session, assessment_id: int, data: QuestionResponseCreate,
+                     existing_by_key: Optional[Dict[_ResponseKey, ResponseV2]] = None,
+                     questions_by_id: Optional[Dict[int, QuestionV2]] = None,
+                     ) -> ResponseV2:
     """Upsert a single response WITHOUT committing.
 
     Shared by the single and bulk endpoints so a batch is one transaction.
+    ``existing_by_key`` (from ``_existing_responses``) replaces the per-answer
+    lookup; rows inserted here are added to it, so a question repeated within
+    a batch updates its first row instead of violating the unique key.
+    ``questions_by_id`` likewise replaces the per-answer question lookup.
     Raises HTTPException(404) if the question is unknown.
     """
-    question = db.query(QuestionV2).filter(QuestionV2.id == data.question_id).first()
+    if questions_by_id is not None:
+        question = questions_by_id.get(data.question_id)
+    else:
+        question = db.get(QuestionV2, data.question_id)
     if not question:
         raise HTTPException(404, "Question not found")
 
@@ -366,11 +394,14 @@ def _upsert_response(db: Session, assessment_id: int, data: QuestionResponseCrea
         except ValueError:
             explicit_status = None
 
-    existing = db.query(ResponseV2).filter(
-        ResponseV2.assessment_id == assessment_id,
-        ResponseV2.question_id == data.question_id,
-        ResponseV2.respondent_role == role_enum,
-    ).first()
+    if existing_by_key is not None:
+        existing = existing_by_key.get((data.question_id, role_enum))
+    else:
+        existing = db.query(ResponseV2).filter(
+            ResponseV2.assessment_id == assessment_id,
+            ResponseV2.question_id == data.question_id,
+            ResponseV2.respondent_role == role_enum,
+        ).first()
 
     # Determine the right evidence_status for this response.
     #
@@ -420,6 +451,8 @@ def _upsert_response(db: Session, assessment_id: int, data: QuestionResponseCrea
         evidence_notes=data.notes,
     )
     db.add(response)
+    if existing_by_key is not None:
+        existing_by_key[(data.question_id, role_enum)] = response
     return response
 
 
@@ -439,16 +472,19 @@ def submit_response(
         )
 
     response = _upsert_response(db, assessment_id, data)
-    db.commit()
-    db.refresh(response)
-
-    return {
+    # flush() assigns the id (INSERT ... RETURNING / lastrowid), so the reply
+    # is built from in-memory state; commit() then expires nothing we still
+    # read, which saves the post-commit refresh SELECT on every answer save.
+    db.flush()
+    result = {
         "id": response.id,
         "question_id": response.question_id,
         "numeric_score": response.numeric_score,
         "evidence_status": response.evidence_status.value if response.evidence_status else None,
         "is_draft": response.is_draft,
     }
+    db.commit()
+    return result
 
 
 @router.post("/assessments/{assessment_id}/responses/bulk")
@@ -463,10 +499,16 @@ def submit_responses_bulk(
     if getattr(assessment, "finalized_at", None) is not None:
         raise HTTPException(403, "Assessment is finalized; responses cannot be modified.")
 
+    # Two queries up front (questions, existing answers) instead of two per
+    # answer; the new rows then go out as batched INSERTs at flush.
+    question_ids = [r.question_id for r in data.responses]
+    questions_by_id = preload_question_bank(db, question_ids)
+    existing_by_key = _existing_responses(db, assessment_id, question_ids)
+
     results = []
     for resp in data.responses:
         try:
-            _upsert_response(db, assessment_id, resp)
+            _upsert_response(db, assessment_id, resp, existing_by_key, questions_by_id)
             results.append({"question_id": resp.question_id, "status": "ok"})
         except HTTPException as e:
             results.append({"question_id": resp.question_id, "status": "error", "detail": e.detail})
@@ -783,8 +825,22 @@ async def upload_evidence(
         verdict, bool(question and question.evidence_required)
     )
 
+    # Everything returned was just set in memory; read it before commit()
+    # expires the row instead of re-selecting it afterwards.
+    response_id = response.id
+    result = {
+        "filename": response.evidence_filename,
+        "mime": response.evidence_mime,
+        "size_bytes": response.evidence_size_bytes,
+        "uploaded_at": response.evidence_uploaded_at.isoformat(),
+        "evidence_status": response.evidence_status.value if response.evidence_status else None,
+        "ai_verdict": verdict,                       # relevant | irrelevant | unclear
+        "ai_reason": response.ai_observations,
+        "ai_suggested_score": response.ai_suggested_score,
+        "ai_confidence": response.ai_confidence,
+        "accepted": verdict != "irrelevant",
+    }
     db.commit()
-    db.refresh(response)
 
     audit.record(
         db,
@@ -792,23 +848,12 @@ async def upload_evidence(
         actor_id=int(current_user.id),
         actor_email=str(current_user.email),
         target_type="response_v2",
-        target_id=response.id,
+        target_id=response_id,
         details={"question_id": question_id, "filename": file.filename,
                  "bytes": stored.bytes, "ai_verdict": verdict},
     )
 
-    return {
-        "filename": response.evidence_filename,
-        "mime": response.evidence_mime,
-        "size_bytes": response.evidence_size_bytes,
-        "uploaded_at": response.evidence_uploaded_at.isoformat(),
-        "evidence_status": response.evidence_status.value if response.evidence_status else None,
-        "ai_verdict": verdict,                       # relevant | irrelevant | unclear
-        "ai_reason": response.ai_observations,
-        "ai_suggested_score": response.ai_suggested_score,
-        "ai_confidence": response.ai_confidence,
-        "accepted": verdict != "irrelevant",
-    }
+    return result
 
 
 @router.get("/assessments/{assessment_id}/responses/{question_id}/evidence")
@@ -1050,8 +1095,9 @@ async def upload_cmms_snapshot(
             except Exception:
                 pass
 
+    db.flush()
+    result = _format_cmms_upload(upload)
     db.commit()
-    db.refresh(upload)
 
     audit.record(
         db,
@@ -1060,10 +1106,10 @@ async def upload_cmms_snapshot(
         actor_email=str(current_user.email),
         target_type="assessment_v2",
         target_id=assessment_id,
-        details={"upload_id": upload.id, "kind": kind, "status": upload.status},
+        details={"upload_id": result["id"], "kind": kind, "status": result["status"]},
     )
 
-    return _format_cmms_upload(upload)
+    return result
 
 
 @router.get("/assessments/{assessment_id}/cmms-uploads")
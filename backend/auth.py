@@ -14,7 +14,11 @@ which holds the app role (admin/auditor/...) for RBAC. A first-time Supabase use
 is auto-provisioned a profile (role=auditor). Access is restricted to the
 @next-belt.com domain (defense-in-depth alongside the Supabase signup trigger).
 """
-from typing import Optional
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -39,10 +43,33 @@ def _jwks() -> Optional["jwt.PyJWKClient"]:
     return _jwk_client
 
 
+# Verified Supabase tokens -> email. The SPA sends the same access token on
+# every call until it refreshes, so re-running the ES256 verification (and a
+# JWKS lookup) per request is wasted work. Entries live at most
+# _TOKEN_CACHE_TTL seconds and never past the token's own exp; keys are
+# digests so raw bearer tokens are not held in memory.
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
 def _email_from_supabase_token(token: str) -> Optional[str]:
     client = _jwks()
     if not client:
         return None
+    key = _token_key(token)
+    now = time.time()
+    with _token_cache_lock:
+        hit = _token_cache.get(key)
+        if hit is not None:
+            if hit[1] > now:
+                return hit[0]
+            del _token_cache[key]
     try:
         signing_key = client.get_signing_key_from_jwt(token)
         payload = jwt.decode(
@@ -53,9 +80,16 @@ def _email_from_supabase_token(token: str) -> Optional[str]:
             issuer=settings.SUPABASE_URL.rstrip("/") + "/auth/v1",
             options={"require": ["exp", "sub"]},
         )
-        return payload.get("email")
     except Exception:
         return None
+    email = payload.get("email")
+    if email:
+        expires = min(now + _TOKEN_CACHE_TTL, float(payload["exp"]))
+        with _token_cache_lock:
+            _token_cache[key] = (email, expires)
+            if len(_token_cache) > _TOKEN_CACHE_MAX:
+                _token_cache.popitem(last=False)
+    return email
 
 
 def _email_from_legacy_token(token: str) -> Optional[str]:
@@ -14,13 +14,28 @@ UNITS POLICY (important — this is what the unit bugs were about):
 Convenience ``*_pct`` keys (percentage 0..100) are provided ONLY for display.
 Scoring code must read the fraction keys, never the ``_pct`` ones.
 """
-from typing import Dict
+from typing import Callable, Dict
 
+import numpy as np
 import pandas as pd
 import re
 
 
 REACTIVE_TYPES = ["emergency", "corrective", "breakdown", "urgent"]
+REACTIVE_PRIORITIES = ["1", "Emergency", "Urgent"]
+
+
+def _count_matching(values: pd.Series, match: Callable[[pd.Index], np.ndarray]) -> int:
+    """Count rows whose ``str()`` value satisfies ``match``.
+
+    CMMS type/priority columns hold a handful of distinct labels over many
+    rows, so the string test runs once per category and the rows are counted
+    from the integer codes. Missing values (code -1) never match.
+    """
+    col = values.astype("category")
+    hits = np.asarray(match(col.cat.categories.astype(str)), dtype=bool)
+    codes = col.cat.codes.to_numpy()
+    return int(hits[codes[codes >= 0]].sum())
 
 
 def calculate_reactive_ratio(work_orders_df: pd.DataFrame) -> Dict:
@@ -34,13 +49,11 @@ def calculate_reactive_ratio(work_orders_df: pd.DataFrame) -> Dict:
     total_wos = len(work_orders_df)
 
     if "work_order_type" in work_orders_df.columns:
-        reactive_count = work_orders_df[
-            work_orders_df["work_order_type"].astype(str).str.lower().isin(REACTIVE_TYPES)
-        ].shape[0]
+        reactive_count = _count_matching(
+            work_orders_df["work_order_type"], lambda c: c.str.lower().isin(REACTIVE_TYPES))
     elif "priority" in work_orders_df.columns:
-        reactive_count = work_orders_df[
-            work_orders_df["priority"].astype(str).isin(["1", "Emergency", "Urgent"])
-        ].shape[0]
+        reactive_count = _count_matching(
+            work_orders_df["priority"], lambda c: c.isin(REACTIVE_PRIORITIES))
     else:
         raise ValueError(
             "Cannot determine work order type — missing 'work_order_type' or 'priority' column"
@@ -72,6 +85,15 @@ def calculate_reactive_ratio(work_orders_df: pd.DataFrame) -> Dict:
     }
 
 
+_NAT_NS = np.iinfo(np.int64).min  # NaT in an int64 nanosecond view
+_DAY_NS = 86_400_000_000_000
+
+
+def _epoch_ns(values: pd.Series) -> np.ndarray:
+    """Parse dates leniently and return them as int64 ns (NaT -> ``_NAT_NS``)."""
+    return pd.to_datetime(values, errors="coerce").dt.as_unit("ns").array.asi8
+
+
 def calculate_pm_compliance(pm_data_df: pd.DataFrame) -> Dict:
     """PM on-time completion rate (7-day grace period).
 
@@ -83,13 +105,15 @@ def calculate_pm_compliance(pm_data_df: pd.DataFrame) -> Dict:
     if "due_date" not in pm_data_df.columns or "completed_date" not in pm_data_df.columns:
         raise ValueError("Missing required columns: 'due_date' and 'completed_date'")
 
-    df = pm_data_df.copy()
-    df["due_date"] = pd.to_datetime(df["due_date"], errors="coerce")
-    df["completed_date"] = pd.to_datetime(df["completed_date"], errors="coerce")
-    df["days_late"] = (df["completed_date"] - df["due_date"]).dt.days
+    # Work on int64 nanosecond views: no DataFrame copy and no datetime or
+    # timedelta columns. Rows with an unparseable/missing date are never on time.
+    due = _epoch_ns(pm_data_df["due_date"])
+    done = _epoch_ns(pm_data_df["completed_date"])
+    dated = (due != _NAT_NS) & (done != _NAT_NS)
+    days_late = (done[dated] - due[dated]) // _DAY_NS  # floors like Timedelta.days
 
-    total_pms = len(df)
-    on_time_pms = int(len(df[df["days_late"] <= 7]))
+    total_pms = len(pm_data_df)
+    on_time_pms = int(np.count_nonzero(days_late <= 7))
     late_pms = total_pms - on_time_pms
 
     compliance_rate = (on_time_pms / total_pms) if total_pms > 0 else 0.0
@@ -105,7 +129,7 @@ def calculate_pm_compliance(pm_data_df: pd.DataFrame) -> Dict:
     else:
         score, severity = 1, "CRITICAL - PM Program Breaking Down"
 
-    late = df[df["days_late"] > 0]["days_late"]
+    late = days_late[days_late > 0]
     return {
         "metric": "PM Compliance",
         "total_pms": total_pms,
@@ -114,14 +138,14 @@ def calculate_pm_compliance(pm_data_df: pd.DataFrame) -> Dict:
         "compliance_rate": round(compliance_rate, 4),          # fraction (canonical)
         "pm_compliance_rate": round(compliance_rate, 4),       # stable alias
         "compliance_rate_pct": round(compliance_rate * 100, 1),  # display only
-        "average_days_late": round(float(late.mean()), 1) if len(late) else 0.0,
+        "average_days_late": round(float(late.mean()), 1) if late.size else 0.0,
         "severity": severity,
         "score": score,
     }
 
 
 # Generic/useless closure codes that carry no diagnostic value.
-_GENERIC_CODES = {"done", "fixed", "complete", "ok", "n/a", "closed", "completed", ""}
+_GENERIC_CODES = frozenset({"done", "fixed", "complete", "ok", "n/a", "closed", "completed", ""})
 
 _COMPONENT_RE = re.compile(
     r"\b(pump|motor|valve|bearing|seal|belt|gear|shaft|coupling|fan|compressor|"
@@ -154,29 +178,26 @@ def calculate_data_graveyard_index(work_orders_df: pd.DataFrame) -> Dict:
 
     total_wos = len(work_orders_df)
 
-    def actionability(notes) -> Dict:
-        if pd.isna(notes) or not str(notes).strip():
-            return {"score": 0, "component": False, "failure": False, "action": False}
+    # One pass over the raw notes, tallying entity counts directly (no
+    # per-row result dicts, no follow-up passes to count them).
+    by_score = [0, 0, 0, 0]  # closures carrying 0..3 of component/failure/action
+    with_component = with_failure = with_action = 0
+    for notes in work_orders_df["closure_notes"].to_numpy():
+        if pd.isna(notes):
+            by_score[0] += 1
+            continue
         text = str(notes).lower()
-        if text.strip() in _GENERIC_CODES:
-            return {"score": 0, "component": False, "failure": False, "action": False}
-        has_component = bool(_COMPONENT_RE.search(text))
-        has_failure = bool(_FAILURE_RE.search(text))
-        has_action = bool(_ACTION_RE.search(text))
-        return {
-            "score": int(has_component) + int(has_failure) + int(has_action),
-            "component": has_component,
-            "failure": has_failure,
-            "action": has_action,
-        }
-
-    results = work_orders_df["closure_notes"].apply(actionability)
-    scores = [r["score"] for r in results]
-
-    high = sum(1 for s in scores if s == 3)
-    medium = sum(1 for s in scores if s == 2)
-    low = sum(1 for s in scores if s == 1)
-    poor = sum(1 for s in scores if s == 0)
+        if text.strip() in _GENERIC_CODES:  # includes blank notes
+            by_score[0] += 1
+            continue
+        has_component = _COMPONENT_RE.search(text) is not None
+        has_failure = _FAILURE_RE.search(text) is not None
+        has_action = _ACTION_RE.search(text) is not None
+        with_component += has_component
+        with_failure += has_failure
+        with_action += has_action
+        by_score[has_component + has_failure + has_action] += 1
+    poor, low, medium, high = by_score
 
     weighted = (
         (high * 100) + (medium * 66) + (low * 33)
@@ -210,8 +231,8 @@ def calculate_data_graveyard_index(work_orders_df: pd.DataFrame) -> Dict:
             "poor_quality_0_entities": poor,
         },
         "semantic_coverage": {
-            "with_component": sum(1 for r in results if r["component"]),
-            "with_failure_mode": sum(1 for r in results if r["failure"]),
-            "with_corrective_action": sum(1 for r in results if r["action"]),
+            "with_component": with_component,
+            "with_failure_mode": with_failure,
+            "with_corrective_action": with_action,
         },
     }
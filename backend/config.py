@@ -56,6 +56,7 @@ class Settings(BaseSettings):
 
     # Reporting & branding (override via env to rebrand without code changes)
     REPORT_OUTPUT_DIR: str = "./reports"
+    REPORT_BUILD_PROCESSES: int = 2          # ReportLab layout workers; 0 = build in the request thread
     LOGO_PATH: Optional[str] = None          # absolute path to firm logo (PNG/SVG-as-PNG)
     FIRM_NAME: str = "NextBelt LLC"
     FIRM_TAGLINE: str = "Reliability & Asset Management Advisory"
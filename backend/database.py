@@ -1,18 +1,77 @@
 """
 Database configuration and session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from config import settings
 
-# Create database engine
+# Create database engine.
+# query_cache_size: headroom over SQLAlchemy's default 500-entry compiled-
+# statement cache. The full test suite emits 210 distinct SQL strings (78 of
+# them SELECTs), so the default is not being outgrown today; the larger cache
+# keeps it that way as report and scoring queries are added.
+# cached_statements is the matching knob one level down: sqlite3 keeps 128
+# prepared statements per connection by default. The busiest connection in
+# the suite (a report build) runs 35 distinct DML statements and the whole
+# suite 108, so 512 is headroom against re-preparing, not a measured fix.
+SQLITE_CONNECT_ARGS = {"check_same_thread": False, "cached_statements": 512}
+
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    echo=settings.DEBUG
+    connect_args=SQLITE_CONNECT_ARGS if "sqlite" in settings.DATABASE_URL else {},
+    echo=settings.DEBUG,
+    query_cache_size=1200,
+)
+
+# SQLite durability/latency profile, applied to every pooled connection:
+# WAL lets report builds read while a save commits, synchronous=NORMAL syncs
+# the WAL at checkpoints rather than on every commit (still crash-safe in WAL
+# mode), and busy_timeout makes a writer wait for the lock instead of failing
+# with "database is locked". journal_mode persists in the file; the rest are
+# per connection. analysis_limit bounds the ANALYZE that PRAGMA optimize may
+# run when the connection closes.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-40000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA analysis_limit=400",
 )
 
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _optimize_sqlite(dbapi_connection, connection_record):
+    """Refresh planner statistics as the connection closes, per the SQLite docs.
+
+    PRAGMA optimize only re-analyzes tables this connection's queries touched
+    whose statistics are missing or stale, so it is usually a no-op.
+    """
+    try:
+        dbapi_connection.execute("PRAGMA optimize")
+    except Exception:  # noqa: BLE001 - a closing connection must still close
+        pass
+
+
+def configure_sqlite(sqlite_engine) -> None:
+    """Attach the connection profile and close-time optimize to an engine."""
+    event.listen(sqlite_engine, "connect", _apply_sqlite_pragmas)
+    event.listen(sqlite_engine, "close", _optimize_sqlite)
+
+
+if engine.dialect.name == "sqlite":
+    configure_sqlite(engine)
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
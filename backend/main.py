@@ -228,6 +228,12 @@ async def _on_startup() -> None:
     _maybe_bootstrap_tables()
 
 
+@app.on_event("shutdown")
+async def _on_shutdown() -> None:
+    # Closing the pool lets each SQLite connection run PRAGMA optimize.
+    engine.dispose()
+
+
 # ---------------------------------------------------------------------------
 # Health
 # ---------------------------------------------------------------------------
@@ -488,7 +494,7 @@ async def generate_report(
 ):
     """Generate the branded executive PDF report for a v2 assessment.
 
-    PDF rendering (matplotlib + reportlab) is CPU-bound, so it runs in a
+    PDF rendering (Chromium or reportlab) is CPU-bound, so it runs in a
     threadpool to avoid blocking the async event loop.
     """
     get_v2_assessment_or_403(db, assessment_id, current_user)
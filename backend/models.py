@@ -50,6 +50,9 @@ class Report(Base):
 
     content = Column(JSON, nullable=True)
     file_path = Column(String(500), nullable=True)
+    # Fingerprint of the report's inputs (see report_cache); lets an unchanged
+    # assessment reuse its last PDF instead of re-rendering.
+    content_hash = Column(String(64), nullable=True)
 
     generated_at = Column(DateTime, default=datetime.utcnow, index=True)
     generated_by = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -288,6 +288,9 @@ class ResponseV2(Base):
     __table_args__ = (
         UniqueConstraint("assessment_id", "question_id", "respondent_role",
                          name="uq_response_v2"),
+        # Scoring, confidence and report queries all filter on
+        # (assessment_id, is_draft, is_na); one range scan finds the rows.
+        Index("ix_responses_v2_scoreable", "assessment_id", "is_draft", "is_na"),
     )
 
 
@@ -1,15 +1,16 @@
 """
 RMI vNext Question Bank Seeder
-Reads the 150-question JSON spec and populates the database.
+Populates the database from the 150-question spec (see question_catalog).
 """
-import json
-import os
-from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from models_v2 import (
     Domain, Subdomain, QuestionV2, DomainType, SubdomainType, TargetRoleV2
 )
+from question_catalog import catalog_domains, question_catalog
 
 # ── Map string codes to enums ──
 DOMAIN_ENUM_MAP = {
@@ -47,57 +48,38 @@ DOMAIN_DESCRIPTIONS = {
 }
 
 
-def _locate_json() -> Path:
-    """Find the question bank JSON relative to this file."""
-    candidates = [
-        Path(__file__).resolve().parent.parent / "docs" / "rmi-vnext" / "04-question-bank.json",
-        Path(__file__).resolve().parent / "04-question-bank.json",
-    ]
-    for p in candidates:
-        if p.exists():
-            return p
-    raise FileNotFoundError(
-        "Could not find 04-question-bank.json. "
-        "Place it in docs/rmi-vnext/ or in the backend/ directory."
-    )
-
-
 def seed_domains_and_subdomains(db: Session) -> dict:
     """Create the 5 domains and 15 subdomains. Returns {code: id} maps."""
     domain_map: dict[str, int] = {}
     subdomain_map: dict[str, int] = {}
 
-    json_path = _locate_json()
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    for d_order, domain_data in enumerate(data["domains"], start=1):
-        code = domain_data["domain_code"]
+    for domain_spec in catalog_domains():
+        code = domain_spec.code
         existing = db.query(Domain).filter(Domain.code == code).first()
         if existing:
             domain_map[code] = existing.id
         else:
             dom = Domain(
                 code=code,
-                name=domain_data["domain_name"],
+                name=domain_spec.name,
                 description=DOMAIN_DESCRIPTIONS.get(code, ""),
-                display_order=d_order,
+                display_order=domain_spec.display_order,
             )
             db.add(dom)
             db.flush()
             domain_map[code] = dom.id
 
-        for sd_order, sub_data in enumerate(domain_data["subdomains"], start=1):
-            sd_code = sub_data["subdomain_code"]
+        for sd_spec in domain_spec.subdomains:
+            sd_code = sd_spec.code
             existing_sd = db.query(Subdomain).filter(Subdomain.code == sd_code).first()
             if existing_sd:
                 subdomain_map[sd_code] = existing_sd.id
             else:
                 sd = Subdomain(
                     code=sd_code,
-                    name=sub_data["subdomain_name"],
+                    name=sd_spec.name,
                     domain_id=domain_map[code],
-                    display_order=d_order * 10 + sd_order,
+                    display_order=sd_spec.display_order,
                 )
                 db.add(sd)
                 db.flush()
@@ -109,58 +91,133 @@ def seed_domains_and_subdomains(db: Session) -> dict:
 
 def seed_question_bank_v2(db: Session) -> int:
     """
-    Seed all 150 questions from the JSON spec.
+    Seed all 150 questions from the catalog.
     Returns the count of questions inserted (skips existing by question_code).
     """
     maps = seed_domains_and_subdomains(db)
     subdomain_map = maps["subdomains"]
 
-    json_path = _locate_json()
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    inserted = 0
-    for domain_data in data["domains"]:
-        for sub_data in domain_data["subdomains"]:
-            sd_code = sub_data["subdomain_code"]
-            sd_id = subdomain_map[sd_code]
-
-            for q_order, q in enumerate(sub_data["questions"], start=1):
-                # Skip if already seeded
-                exists = db.query(QuestionV2).filter(
-                    QuestionV2.question_code == q["question_code"]
-                ).first()
-                if exists:
-                    continue
-
-                # Determine the domain code from the subdomain code (e.g. "WC.1" → "WC")
-                domain_code = sd_code.split(".")[0]
-                question = QuestionV2(
-                    question_code=q["question_code"],
-                    question_text=q["question_text"],
-                    question_type=q["question_type"],
-                    domain=DOMAIN_ENUM_MAP[domain_code],
-                    subdomain_id=sd_id,
-                    target_role=ROLE_MAP.get(q.get("target_role"), TargetRoleV2.TECHNICIAN),
-                    # Store a real JSON array (the column is JSON). An older
-                    # revision json.dumps'd this into a string, which made the
-                    # SQL `contains` filter fail on Postgres; routing now parses
-                    # modes in Python so both encodings work, but new rows should
-                    # be clean arrays.
-                    assessment_modes=q.get("assessment_mode", ["standard", "deepdive"]),
-                    weight=q.get("weight", 1.0),
-                    is_critical=q.get("is_critical", False),
-                    evidence_required=q.get("evidence_required", False),
-                    evidence_guidance=q.get("evidence_guidance"),
-                    scoring_rubric=json.dumps(q.get("scoring_rubric", {})),
-                    iso_55001_clause=q.get("iso_55001_clause"),
-                    calibration_anchor=q.get("calibration_anchor"),
-                    practice_link=q.get("practice_link"),
-                    is_active=True,
-                )
-                db.add(question)
-                inserted += 1
-
+    # One round trip for the existing codes instead of one probe per question.
+    seeded = set(db.scalars(select(QuestionV2.question_code)))
+
+    rows = []
+    for q in question_catalog().values():
+        sd_code = q["subdomain_code"]
+        if q["question_code"] in seeded:
+            continue
+
+        # Determine the domain code from the subdomain code (e.g. "WC.1" → "WC")
+        domain_code = sd_code.split(".")[0]
+        rows.append(dict(
+            question_code=q["question_code"],
+            question_text=q["question_text"],
+            question_type=q["question_type"],
+            domain=DOMAIN_ENUM_MAP[domain_code],
+            subdomain_id=subdomain_map[sd_code],
+            target_role=ROLE_MAP.get(q.get("target_role"), TargetRoleV2.TECHNICIAN),
+            # Store a real JSON array (the column is JSON). An older
+            # revision json.dumps'd this into a string, which made the
+            # SQL `contains` filter fail on Postgres; routing now parses
+            # modes in Python so both encodings work, but new rows should
+            # be clean arrays.
+            assessment_modes=q.get("assessment_mode", ["standard", "deepdive"]),
+            weight=q.get("weight", 1.0),
+            is_critical=q.get("is_critical", False),
+            evidence_required=q.get("evidence_required", False),
+            evidence_guidance=q.get("evidence_guidance"),
+            # Same for the rubric: the JSON column encodes the dict itself;
+            # a pre-dumped string was encoded twice and had to be parsed
+            # back on every read.
+            scoring_rubric=q.get("scoring_rubric", {}),
+            iso_55001_clause=q.get("iso_55001_clause"),
+            calibration_anchor=q.get("calibration_anchor"),
+            practice_link=q.get("practice_link"),
+            is_active=True,
+        ))
+
+    # One executemany through Core, with no per-row ORM unit-of-work
+    # bookkeeping.
+    if rows:
+        db.execute(insert(QuestionV2), rows)
     db.commit()
+    inserted = len(rows)
     print(f"[seed] Inserted {inserted} vNext questions.")
     return inserted
+
+
+# ── Read helpers ──
+# Routing only ever reads question scalars, so the getters below project plain
+# columns into QuestionDTO snapshots instead of hydrating Session-bound ORM
+# instances. Snapshots are immutable, safe to share across threads, and can
+# never trigger a lazy-load.
+
+class QuestionDTO(NamedTuple):
+    """Read-only snapshot of an active question_bank_v2 row."""
+    id: int
+    question_code: str
+    question_text: str
+    question_type: str
+    domain: DomainType
+    subdomain_id: int
+    target_role: TargetRoleV2
+    weight: Optional[float]
+    is_critical: bool
+    evidence_required: bool
+    evidence_guidance: Optional[str]
+    scoring_rubric: Any
+    assessment_modes: Any
+    calibration_anchor: Optional[str]
+    iso_55001_clause: Optional[str]
+    practice_link: Optional[str]
+
+
+_DTO_COLUMNS = tuple(getattr(QuestionV2, name) for name in QuestionDTO._fields)
+
+
+def get_questions_by_subdomain(db: Session, subdomain_id: int) -> List[QuestionDTO]:
+    """Active questions for a subdomain, best-first (critical, then weight)."""
+    stmt = (
+        select(*_DTO_COLUMNS)
+        .where(QuestionV2.subdomain_id == subdomain_id, QuestionV2.is_active == True)  # noqa: E712
+        .order_by(
+            QuestionV2.is_critical.desc(),
+            QuestionV2.weight.desc(),
+            QuestionV2.question_code,
+        )
+    )
+    return [QuestionDTO(*row) for row in db.execute(stmt)]
+
+
+def iter_active_questions(
+    db: Session,
+    target_role: Optional[TargetRoleV2] = None,
+    batch: int = 100,
+) -> Iterator[QuestionDTO]:
+    """Stream every active question in catalog order (subdomain, then code).
+
+    DeepDive routes the whole bank, which grows with every industry module and
+    custom question. ``yield_per`` keeps only one batch of rows in memory (and
+    uses a server-side cursor on Postgres) instead of materializing the catalog.
+    """
+    stmt = (
+        select(*_DTO_COLUMNS)
+        .join(Subdomain, QuestionV2.subdomain_id == Subdomain.id)
+        .where(QuestionV2.is_active == True)  # noqa: E712
+        .order_by(Subdomain.display_order, QuestionV2.question_code)
+        .execution_options(yield_per=batch)
+    )
+    if target_role is not None:
+        stmt = stmt.where(QuestionV2.target_role == target_role)
+    for row in db.execute(stmt):
+        yield QuestionDTO(*row)
+
+
+def preload_question_bank(db: Session, question_ids: Iterable[int]) -> Dict[int, QuestionV2]:
+    """Load the given questions in one query, keyed by id.
+
+    Callers must keep the returned mapping; lookups go through it. The
+    Session holds clean instances only weakly, so a later ``db.get()`` is not
+    guaranteed to hit the identity map once the mapping is dropped.
+    """
+    stmt = select(QuestionV2).where(QuestionV2.id.in_(set(question_ids)))
+    return {q.id: q for q in db.scalars(stmt)}
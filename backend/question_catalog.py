@@ -0,0 +1,112 @@
+"""
+RMI vNext Question Catalog
+Read-only, in-process view of the 150-question JSON spec.
+
+The spec is static configuration that ships with the repo, so it is parsed
+once per process and exposed as immutable mappings. The seeder and anything
+else that needs spec metadata (rubrics, calibration anchors, ISO clauses)
+read from here instead of re-opening the file.
+
+The database stays the source of truth for question ids -- responses reference
+question_bank_v2 rows -- and for customer-added questions that are not in the
+spec.
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Tuple
+
+
+# A rubric as ((score, descriptor), ...) sorted by score.
+RubricLevels = Tuple[Tuple[int, str], ...]
+
+
+class CatalogSubdomain(NamedTuple):
+    code: str
+    name: str
+    display_order: int  # domain_order * 10 + subdomain_order
+
+
+class CatalogDomain(NamedTuple):
+    code: str
+    name: str
+    display_order: int
+    subdomains: Tuple[CatalogSubdomain, ...]
+
+
+def locate_json() -> Path:
+    """Find the question bank JSON relative to this file."""
+    candidates = [
+        Path(__file__).resolve().parent.parent / "docs" / "rmi-vnext" / "04-question-bank.json",
+        Path(__file__).resolve().parent / "04-question-bank.json",
+    ]
+    for p in candidates:
+        if p.exists():
+            return p
+    raise FileNotFoundError(
+        "Could not find 04-question-bank.json. "
+        "Place it in docs/rmi-vnext/ or in the backend/ directory."
+    )
+
+
+@lru_cache(maxsize=1)
+def _load() -> Tuple[Tuple[CatalogDomain, ...], Mapping[str, Mapping[str, Any]]]:
+    with open(locate_json(), "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    domains = []
+    questions: dict[str, Mapping[str, Any]] = {}
+    for d_order, domain_data in enumerate(data["domains"], start=1):
+        subdomains = []
+        for sd_order, sub_data in enumerate(domain_data["subdomains"], start=1):
+            sd_code = sub_data["subdomain_code"]
+            subdomains.append(
+                CatalogSubdomain(sd_code, sub_data["subdomain_name"], d_order * 10 + sd_order)
+            )
+            for q in sub_data["questions"]:
+                questions[q["question_code"]] = MappingProxyType({**q, "subdomain_code": sd_code})
+        domains.append(
+            CatalogDomain(
+                domain_data["domain_code"], domain_data["domain_name"], d_order, tuple(subdomains)
+            )
+        )
+    return tuple(domains), MappingProxyType(questions)
+
+
+def catalog_domains() -> Tuple[CatalogDomain, ...]:
+    """The 5 domains (with their subdomains) in spec order."""
+    return _load()[0]
+
+
+def question_catalog() -> Mapping[str, Mapping[str, Any]]:
+    """Spec entries keyed by question_code, in spec order.
+
+    Each entry is the raw JSON object plus its ``subdomain_code``. The
+    mappings are read-only; nested values (rubric dicts, mode lists) are
+    shared across callers and must not be mutated.
+    """
+    return _load()[1]
+
+
+def rubric_levels(rubric: Any) -> RubricLevels:
+    """Normalize a stored rubric to ``((1, "..."), ..., (5, "..."))``.
+
+    Accepts the spec/DB shape ``{"1": "...", ...}`` as well as the legacy
+    double-encoded JSON string. Non-numeric keys are dropped; anything
+    unparseable yields an empty tuple.
+    """
+    if isinstance(rubric, str):
+        try:
+            rubric = json.loads(rubric)
+        except (json.JSONDecodeError, TypeError):
+            return ()
+    if not isinstance(rubric, dict):
+        return ()
+    levels = []
+    for key, descriptor in rubric.items():
+        try:
+            levels.append((int(key), descriptor))
+        except (TypeError, ValueError):
+            continue
+    return tuple(sorted(levels))
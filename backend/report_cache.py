@@ -0,0 +1,142 @@
+"""
+Content-keyed reuse of generated executive reports.
+
+Rendering (Chromium or ReportLab) dominates report cost, and "Generate report"
+is routinely clicked again with nothing changed. Each registry row stores a
+fingerprint of everything its PDF was built from; when the latest report for an
+assessment carries the same fingerprint and its file is still on disk, the
+generators hand back that file instead of rendering it again.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+try:  # optional C encoder; the fingerprint only has to be stable per install
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+from config import settings
+from models import Report
+from models_v2 import AssessmentV2, CMMSUploadV2, QuestionV2, ResponseV2, SubdomainScore
+
+# Every setting either renderer prints or draws. Both generators are checked
+# against this tuple in tests, so a new branding field can't be left out.
+REPORT_SETTINGS = (
+    "FIRM_NAME", "FIRM_TAGLINE", "FIRM_WEBSITE", "FIRM_EMAIL", "LOGO_PATH",
+    "BRAND_PRIMARY_HEX", "BRAND_DARK_HEX", "BRAND_ACCENT_HEX",
+    "REPORT_CONFIDENTIAL_LABEL",
+)
+
+
+def report_content_hash(db: Session, a: AssessmentV2, report_type: str) -> str:
+    """Fingerprint of every input that feeds an executive report.
+
+    Covers the assessment row, its persisted subdomain scores, every response
+    together with the question fields scoring reads (scoring is recomputed
+    from them at render time), processed CMMS uploads, the peer population
+    behind the benchmark, the ``REPORT_SETTINGS`` branding and the logo file,
+    the app version, and the calendar day (the PDF prints the generation date).
+    """
+    scores = db.execute(
+        select(SubdomainScore.subdomain_id, SubdomainScore.final_score,
+               SubdomainScore.cap_applied, SubdomainScore.cap_reason)
+        .where(SubdomainScore.assessment_id == a.id)
+        .order_by(SubdomainScore.subdomain_id)
+    ).all()
+    responses = db.execute(
+        select(ResponseV2.id, ResponseV2.question_id, ResponseV2.respondent_role,
+               ResponseV2.numeric_score, ResponseV2.evidence_status,
+               ResponseV2.evidence_grade, ResponseV2.is_draft, ResponseV2.is_na,
+               ResponseV2.answered_at,
+               QuestionV2.subdomain_id, QuestionV2.weight, QuestionV2.is_critical,
+               QuestionV2.evidence_required, QuestionV2.is_active)
+        .outerjoin(QuestionV2, ResponseV2.question_id == QuestionV2.id)
+        .where(ResponseV2.assessment_id == a.id)
+        .order_by(ResponseV2.id)
+    ).all()
+    uploads = db.execute(
+        select(CMMSUploadV2.id, CMMSUploadV2.status, CMMSUploadV2.uploaded_at)
+        .where(CMMSUploadV2.assessment_id == a.id)
+        .order_by(CMMSUploadV2.id)
+    ).all()
+    peers = db.execute(
+        select(func.count(AssessmentV2.id), func.max(AssessmentV2.updated_at))
+        .where(AssessmentV2.overall_rmi.isnot(None))
+    ).one()
+
+    payload = [
+        report_type, settings.VERSION, datetime.utcnow().date(),
+        [getattr(settings, name) for name in REPORT_SETTINGS], _logo_stamp(),
+        a.id, a.updated_at, a.overall_rmi,
+        [tuple(r) for r in scores], [tuple(r) for r in responses],
+        [tuple(r) for r in uploads], tuple(peers),
+    ]
+    return hashlib.blake2b(_encode(payload), digest_size=32).hexdigest()
+
+
+def _logo_stamp() -> Optional[tuple]:
+    """Size and mtime of the configured logo, so replacing the file in place
+    invalidates cached reports too."""
+    path = settings.LOGO_PATH
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _encode(payload: list) -> bytes:
+    """Compact JSON bytes for hashing; unknown types fall back to ``str()``."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str)
+    return json.dumps(payload, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def find_cached_report(db: Session, assessment_id: int, content_hash: str) -> Optional[str]:
+    """Path of the current report if it was built from identical inputs.
+
+    Only the latest registry row counts -- it is the one the download endpoint
+    serves, and both renderers write to the same dated filename, so an older
+    row's file may since have been overwritten.
+    """
+    latest = db.execute(
+        select(Report.content_hash, Report.file_path)
+        .where(Report.assessment_id == assessment_id)
+        .order_by(Report.generated_at.desc(), Report.id.desc())
+        .limit(1)
+    ).first()
+    if latest is None or latest.content_hash != content_hash:
+        return None
+    if not latest.file_path or not os.path.isfile(latest.file_path):
+        return None
+    return latest.file_path
+
+
+def write_report_file(filepath: str, data: bytes) -> None:
+    """Write a finished PDF with one write() and swap it into place atomically.
+
+    Regenerating reuses the dated filename, so writing in place could let the
+    download endpoint (or a cache hit) serve a half-written file.
+    """
+    tmp = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
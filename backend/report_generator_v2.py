@@ -11,24 +11,29 @@ driven entirely by config so the report can be rebranded without code changes.
 """
 from __future__ import annotations
 
+import heapq
 import io
 import logging
+import multiprocessing
 import os
+import pickle
 import re
+import threading
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Dict, List, Optional
-
-import matplotlib
-
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt  # noqa: E402
-import numpy as np  # noqa: E402
-from reportlab.lib import colors  # noqa: E402
-from reportlab.lib.enums import TA_CENTER, TA_LEFT  # noqa: E402
-from reportlab.lib.pagesizes import letter  # noqa: E402
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet  # noqa: E402
-from reportlab.lib.units import inch  # noqa: E402
-from reportlab.platypus import (  # noqa: E402
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from reportlab.graphics.shapes import Circle, Drawing, Line, Polygon, String
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import (
     HRFlowable,
     Image,
     KeepTogether,
@@ -39,11 +44,12 @@ from reportlab.platypus import (  # noqa: E402
     Table,
     TableStyle,
 )
-from sqlalchemy.orm import Session  # noqa: E402
+from sqlalchemy import func
+from sqlalchemy.orm import Session
 
-from config import settings  # noqa: E402
-from models import Report  # noqa: E402  -- report registry row (reused for /report/download)
-from models_v2 import (  # noqa: E402
+from config import settings
+from models import Report  # report registry row (reused for /report/download)
+from models_v2 import (
     AssessmentV2,
     CMMSUploadV2,
     Domain,
@@ -51,11 +57,26 @@ from models_v2 import (  # noqa: E402
     Subdomain,
     SubdomainScore,
 )
-from scoring_engine_v2 import ScoringEngineV2  # noqa: E402
+from report_cache import find_cached_report, report_content_hash, write_report_file
+from scoring_engine_v2 import ScoringEngineV2
 
 logger = logging.getLogger(__name__)
 
 _FILENAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_MID_HEX = "#6B7670"
+_BG_HEX = "#F1F5F3"
+
+# Page geometry. Frames and page templates carry per-build layout state, so
+# each report gets a fresh SimpleDocTemplate; only the numbers are shared.
+_PAGE_W, _PAGE_H = letter
+_PAGE_MARGINS = {
+    "topMargin": 0.9 * inch, "bottomMargin": 0.8 * inch,
+    "leftMargin": 0.85 * inch, "rightMargin": 0.85 * inch,
+}
+_RULE_X0, _RULE_X1 = 0.85 * inch, _PAGE_W - 0.85 * inch
+_HEADER_RULE_Y, _HEADER_TEXT_Y = _PAGE_H - 0.6 * inch, _PAGE_H - 0.52 * inch
+_FOOTER_RULE_Y, _FOOTER_TEXT_Y = 0.62 * inch, 0.46 * inch
+_FOOTER_RULE_COLOR = colors.HexColor("#D8E0DC")
 
 # 5 domains → 3 client-facing pillars
 PILLAR_MAP: Dict[str, List[str]] = {
@@ -74,44 +95,50 @@ PILLAR_FOCUS = {
 }
 
 # Curated 30/60/90 actions per domain (used when a weakest-link area is found)
-DOMAIN_ROADMAP: Dict[str, Dict[str, List[str]]] = {
+DOMAIN_ROADMAP: Dict[str, Dict[str, Tuple[str, ...]]] = {
     "WC": {
-        "30": ["Run a skills-matrix gap analysis for all maintenance roles",
-               "Launch weekly reliability toolbox talks"],
-        "60": ["Stand up a competency-based training program with certification paths",
-               "Formalize knowledge-transfer pairing (senior to junior technicians)"],
-        "90": ["Establish a Reliability Technician certification track and career ladder"],
+        "30": ("Run a skills-matrix gap analysis for all maintenance roles",
+               "Launch weekly reliability toolbox talks"),
+        "60": ("Stand up a competency-based training program with certification paths",
+               "Formalize knowledge-transfer pairing (senior to junior technicians)"),
+        "90": ("Establish a Reliability Technician certification track and career ladder",),
     },
     "LC": {
-        "30": ["Publish and brief stop-work authority and safety expectations",
-               "Hold a leadership reliability alignment session"],
-        "60": ["Define reliability KPIs reviewed by leadership on a fixed cadence",
-               "Clarify maintenance org structure and accountability (RACI)"],
-        "90": ["Embed a proactive reliability culture program with frontline ownership"],
+        "30": ("Publish and brief stop-work authority and safety expectations",
+               "Hold a leadership reliability alignment session"),
+        "60": ("Define reliability KPIs reviewed by leadership on a fixed cadence",
+               "Clarify maintenance org structure and accountability (RACI)"),
+        "90": ("Embed a proactive reliability culture program with frontline ownership",),
     },
     "WM": {
-        "30": ["Audit the last 100 work orders for planning/execution quality",
-               "Create standardized job plans for the top 20 critical PM tasks"],
-        "60": ["Deploy a planner-approved work-order planning checklist",
-               "Run PM optimization (RCM/PMO) on critical assets; manage backlog by priority"],
-        "90": ["Institute a 2-week forward schedule with schedule-compliance KPIs"],
+        "30": ("Audit the last 100 work orders for planning/execution quality",
+               "Create standardized job plans for the top 20 critical PM tasks"),
+        "60": ("Deploy a planner-approved work-order planning checklist",
+               "Run PM optimization (RCM/PMO) on critical assets; manage backlog by priority"),
+        "90": ("Institute a 2-week forward schedule with schedule-compliance KPIs",),
     },
     "AI": {
-        "30": ["Audit CMMS data quality (closure codes, failure modes, completeness)",
-               "Stand up a Top-10 bad-actor dashboard by downtime"],
-        "60": ["Align failure taxonomy to ISO 14224; enforce mandatory WO fields",
-               "Enable mobile CMMS capture for field technicians"],
-        "90": ["Launch a predictive-maintenance pilot and a leadership reliability dashboard"],
+        "30": ("Audit CMMS data quality (closure codes, failure modes, completeness)",
+               "Stand up a Top-10 bad-actor dashboard by downtime"),
+        "60": ("Align failure taxonomy to ISO 14224; enforce mandatory WO fields",
+               "Enable mobile CMMS capture for field technicians"),
+        "90": ("Launch a predictive-maintenance pilot and a leadership reliability dashboard",),
     },
     "SG": {
-        "30": ["Draft/ratify a written asset-management policy and objectives",
-               "Define the reliability metric set (leading + lagging)"],
-        "60": ["Stand up monthly performance reviews against AM objectives",
-               "Establish a continuous-improvement (RCA to action) loop"],
-        "90": ["Mature toward ISO 55001 alignment with an audited management system"],
+        "30": ("Draft/ratify a written asset-management policy and objectives",
+               "Define the reliability metric set (leading + lagging)"),
+        "60": ("Stand up monthly performance reviews against AM objectives",
+               "Establish a continuous-improvement (RCA to action) loop"),
+        "90": ("Mature toward ISO 55001 alignment with an audited management system",),
     },
 }
 
+ROADMAP_PHASES = (
+    ("First 30 Days — Quick Wins", "30"),
+    ("Days 31–60 — Capability Building", "60"),
+    ("Days 61–90 — Strategic Initiatives", "90"),
+)
+
 
 def _slug(name: str) -> str:
     return _FILENAME_RE.sub("_", name or "").strip("._-") or "unknown"
@@ -124,32 +151,209 @@ def _hex(value: str):
         return colors.HexColor("#0E6E62")
 
 
+# Maturity bands: score < 2.0 → level 1, [2.0, 3.0) → 2, [3.0, 3.6) → 3,
+# [3.6, 4.3) → 4, ≥ 4.3 → 5. bisect_right on the lower bounds gives the index.
+_LEVEL_BOUNDS = (2.0, 3.0, 3.6, 4.3)
+_LEVEL_LABELS = (
+    "Level 1 — Reactive",
+    "Level 2 — Emerging",
+    "Level 3 — Systematic",
+    "Level 4 — Proactive",
+    "Level 5 — Prescriptive",
+)
+_LEVEL_COLORS = tuple(
+    colors.HexColor(h) for h in ("#C0392B", "#E67E22", "#B8860B", "#2F8A6B", "#16745F")
+)
+_UNSCORED_COLOR = colors.HexColor("#9AA5A1")
+
+# Key-findings narrative per domain band: < 2.5, [2.5, 3.5), [3.5, 4.3), ≥ 4.3.
+_FINDING_BOUNDS = (2.5, 3.5, 4.3)
+_FINDING_TEXT = (
+    "Critical gap. Foundational practices are absent or inconsistent; immediate "
+    "intervention is required to arrest reliability risk.",
+    "Emerging. Practices exist but are not yet systematic; targeted improvement will "
+    "move this domain to a proactive footing.",
+    "Solid proactive foundation; well positioned to advance toward predictive and "
+    "prescriptive practice.",
+    "Best-in-class. Focus on sustainment, knowledge transfer, and continuous improvement.",
+)
+
+
 def _maturity_label(score: Optional[float]) -> str:
     if score is None:
         return "Not scored"
-    if score < 2.0:
-        return "Level 1 — Reactive"
-    if score < 3.0:
-        return "Level 2 — Emerging"
-    if score < 3.6:
-        return "Level 3 — Systematic"
-    if score < 4.3:
-        return "Level 4 — Proactive"
-    return "Level 5 — Prescriptive"
+    return _LEVEL_LABELS[bisect_right(_LEVEL_BOUNDS, score)]
 
 
 def _score_color(score: Optional[float]):
     if score is None:
-        return colors.HexColor("#9AA5A1")
-    if score < 2.0:
-        return colors.HexColor("#C0392B")
-    if score < 3.0:
-        return colors.HexColor("#E67E22")
-    if score < 3.6:
-        return colors.HexColor("#B8860B")
-    if score < 4.3:
-        return colors.HexColor("#2F8A6B")
-    return colors.HexColor("#16745F")
+        return _UNSCORED_COLOR
+    return _LEVEL_COLORS[bisect_right(_LEVEL_BOUNDS, score)]
+
+
+@lru_cache(maxsize=16)
+def _radar_axes(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(cos, sin) of the n axis angles: first axis at 12 o'clock, clockwise.
+
+    Depends only on the axis count, so each shape is computed once per process.
+    The arrays are shared, hence read-only.
+    """
+    angles = np.pi / 2 - np.linspace(0.0, 2 * np.pi, n, endpoint=False)
+    cos, sin = np.cos(angles), np.sin(angles)
+    cos.flags.writeable = False
+    sin.flags.writeable = False
+    return cos, sin
+
+
+def _radar_vertices(values, cx: float, cy: float, radius: float) -> np.ndarray:
+    """Flat [x0, y0, x1, y1, ...] polygon for scores on a 0–5 radar.
+
+    Scores are clamped to 0–5 and None counts as 0.
+    """
+    vals = np.nan_to_num(np.asarray(values, dtype=float))
+    cos, sin = _radar_axes(len(vals))
+    r = np.clip(vals, 0.0, 5.0) * (radius / 5.0)
+    return np.column_stack((cx + r * cos, cy + r * sin)).ravel()
+
+
+# Every report draws a pillar radar and a domain radar; warm both shapes.
+_radar_axes(len(PILLAR_MAP))
+_radar_axes(len(DOMAIN_ROADMAP))
+
+
+@lru_cache(maxsize=1)
+def _sample_styles():
+    # getSampleStyleSheet() builds ~20 styles from scratch on every call.
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=4)
+def _paragraph_styles(primary_hex: str, dark_hex: str, accent_hex: str) -> Dict[str, ParagraphStyle]:
+    """Report paragraph styles, built once per brand palette.
+
+    Styles are only read by Paragraph, so one set is shared by every report.
+    """
+    base = _sample_styles()
+    primary, dark, accent = _hex(primary_hex), _hex(dark_hex), _hex(accent_hex)
+    mid, bg = colors.HexColor(_MID_HEX), colors.HexColor(_BG_HEX)
+    return {
+        "title": ParagraphStyle("Title", parent=base["Heading1"], fontSize=26,
+                                textColor=primary, alignment=TA_CENTER, leading=30,
+                                spaceAfter=6),
+        "subtitle": ParagraphStyle("Subtitle", parent=base["Normal"], fontSize=13,
+                                   textColor=dark, alignment=TA_CENTER, leading=18),
+        "h2": ParagraphStyle("H2", parent=base["Heading2"], fontSize=15,
+                             textColor=primary, spaceBefore=14, spaceAfter=6),
+        "h3": ParagraphStyle("H3", parent=base["Heading3"], fontSize=11.5,
+                             textColor=dark, spaceBefore=8, spaceAfter=4),
+        "body": ParagraphStyle("Body", parent=base["BodyText"], fontSize=9.5,
+                               textColor=dark, leading=14, alignment=TA_LEFT),
+        "small": ParagraphStyle("Small", parent=base["BodyText"], fontSize=8,
+                                textColor=mid, leading=11),
+        "callout": ParagraphStyle("Callout", parent=base["BodyText"], fontSize=10,
+                                  textColor=dark, leading=15, backColor=bg,
+                                  borderColor=accent, borderWidth=0, borderPadding=10,
+                                  leftIndent=6, rightIndent=6, spaceAfter=8),
+    }
+
+
+# ---------------------------------------------------------------------------
+# PDF build (off the web process)
+#
+# doc.build() is pure-Python layout and holds the GIL for the whole report, so
+# running it on a request thread stalls every other handler in the worker. The
+# story is assembled in-process (it needs the DB session) and pickled to a small
+# spawn-based process pool, which returns the finished PDF bytes.
+# ---------------------------------------------------------------------------
+
+_BUILD_POOL: Optional[ProcessPoolExecutor] = None
+_BUILD_POOL_LOCK = threading.Lock()
+
+
+def _build_pool() -> Optional[ProcessPoolExecutor]:
+    global _BUILD_POOL
+    if settings.REPORT_BUILD_PROCESSES <= 0:
+        return None
+    with _BUILD_POOL_LOCK:
+        if _BUILD_POOL is None:
+            # spawn, not fork: the parent has live DB connections and threads.
+            _BUILD_POOL = ProcessPoolExecutor(
+                max_workers=settings.REPORT_BUILD_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _BUILD_POOL
+
+
+def _reset_build_pool() -> None:
+    global _BUILD_POOL
+    with _BUILD_POOL_LOCK:
+        pool, _BUILD_POOL = _BUILD_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _page_furniture(furniture: Tuple[str, ...], canvas, doc) -> None:
+    firm_name, confidential, website, primary_hex = furniture
+    primary, mid = _hex(primary_hex), colors.HexColor(_MID_HEX)
+    canvas.saveState()
+    # Header rule + firm name
+    canvas.setStrokeColor(primary)
+    canvas.setLineWidth(0.75)
+    canvas.line(_RULE_X0, _HEADER_RULE_Y, _RULE_X1, _HEADER_RULE_Y)
+    canvas.setFont("Helvetica-Bold", 8)
+    canvas.setFillColor(primary)
+    canvas.drawString(_RULE_X0, _HEADER_TEXT_Y, firm_name.upper())
+    canvas.setFont("Helvetica", 7.5)
+    canvas.setFillColor(mid)
+    canvas.drawRightString(_RULE_X1, _HEADER_TEXT_Y,
+                           "Reliability Maturity Index — Executive Audit")
+    # Footer
+    canvas.setStrokeColor(_FOOTER_RULE_COLOR)
+    canvas.setLineWidth(0.5)
+    canvas.line(_RULE_X0, _FOOTER_RULE_Y, _RULE_X1, _FOOTER_RULE_Y)
+    canvas.setFont("Helvetica", 7)
+    canvas.setFillColor(mid)
+    canvas.drawString(_RULE_X0, _FOOTER_TEXT_Y, confidential)
+    canvas.drawCentredString(_PAGE_W / 2.0, _FOOTER_TEXT_Y, website)
+    canvas.drawRightString(_RULE_X1, _FOOTER_TEXT_Y, f"Page {doc.page}")
+    canvas.restoreState()
+
+
+def _build_pdf(story: list, title: str, furniture: Tuple[str, ...]) -> bytes:
+    """Lay out ``story`` on branded letter pages and return the PDF bytes."""
+    pdf = io.BytesIO()
+    doc = SimpleDocTemplate(pdf, pagesize=letter, **_PAGE_MARGINS,
+                            title=title, author=furniture[0])
+    on_page = partial(_page_furniture, furniture)
+    doc.build(story, onFirstPage=on_page, onLaterPages=on_page)
+    return pdf.getvalue()
+
+
+def _build_pdf_pickled(payload: bytes) -> bytes:
+    """Pool entry point: ``payload`` is the pickled ``_build_pdf`` arguments."""
+    return _build_pdf(*pickle.loads(payload))
+
+
+def _render_pdf(story: list, title: str, furniture: Tuple[str, ...]) -> bytes:
+    """Build in the process pool; fall back to this thread if that is not possible.
+
+    The arguments are pickled here, before submitting, so an unpicklable story
+    is caught up front; anything the build itself raises in the worker
+    propagates unchanged rather than triggering a second in-process build.
+    """
+    pool = _build_pool()
+    if pool is not None:
+        try:
+            payload = pickle.dumps((story, title, furniture), pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            logger.warning("Report story not picklable (%s); building in-process", exc)
+        else:
+            try:
+                return pool.submit(_build_pdf_pickled, payload).result()
+            except BrokenProcessPool as exc:
+                logger.warning("Report build pool died (%s); rebuilding in-process", exc)
+                _reset_build_pool()
+    return _build_pdf(story, title, furniture)
 
 
 class ReportGeneratorV2:
@@ -162,8 +366,8 @@ class ReportGeneratorV2:
         self.PRIMARY = _hex(settings.BRAND_PRIMARY_HEX)
         self.DARK = _hex(settings.BRAND_DARK_HEX)
         self.ACCENT = _hex(settings.BRAND_ACCENT_HEX)
-        self.MID = colors.HexColor("#6B7670")
-        self.BG = colors.HexColor("#F1F5F3")
+        self.MID = colors.HexColor(_MID_HEX)
+        self.BG = colors.HexColor(_BG_HEX)
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -174,6 +378,11 @@ class ReportGeneratorV2:
         if not a:
             raise ValueError(f"Assessment {assessment_id} not found")
 
+        content_hash = report_content_hash(self.db, a, "executive_v2")
+        cached = find_cached_report(self.db, assessment_id, content_hash)
+        if cached:
+            return cached
+
         # Compute the rich scoring view WITHOUT persisting — generating a report
         # must never mutate the assessment's official scores. domain_rollup below
         # reads the persisted SubdomainScores (the scores that were signed off).
@@ -186,10 +395,13 @@ class ReportGeneratorV2:
 
         domain_rollup = self._domain_rollup(assessment_id)
         pillar_rollup = self._pillar_rollup(domain_rollup)
+        # Scored (code, domain) pairs, weakest first. The fallback overall, the
+        # findings and the roadmap focus all read this one sort.
+        ranked = sorted(((c, d) for c, d in domain_rollup.items() if d["score"] is not None),
+                        key=lambda x: x[1]["score"])
         overall = a.overall_rmi
-        if overall is None and domain_rollup:
-            vals = [d["score"] for d in domain_rollup.values() if d["score"] is not None]
-            overall = round(sum(vals) / len(vals), 2) if vals else None
+        if overall is None and ranked:
+            overall = round(sum(d["score"] for _, d in ranked) / len(ranked), 2)
 
         benchmark = self._safe_benchmark(assessment_id)
         cmms_uploads = (
@@ -207,14 +419,6 @@ class ReportGeneratorV2:
         )
         filepath = os.path.join(self.output_dir, filename)
 
-        doc = SimpleDocTemplate(
-            filepath, pagesize=letter,
-            topMargin=0.9 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.85 * inch, rightMargin=0.85 * inch,
-            title=f"RMI Executive Report — {a.client_name} {a.site_name}",
-            author=settings.FIRM_NAME,
-        )
-
         story: list = []
         story += self._cover(a, overall, styles)
         story.append(PageBreak())
@@ -222,17 +426,24 @@ class ReportGeneratorV2:
         story += self._pillar_section(pillar_rollup, styles)
         story.append(PageBreak())
         story += self._domain_section(domain_rollup, benchmark, styles)
-        story += self._subdomain_section(assessment_id, styles)
+        story += self._subdomain_section(domain_rollup, styles)
         story.append(PageBreak())
-        story += self._findings_section(domain_rollup, scoring, styles)
+        story += self._findings_section(ranked, scoring, styles)
         if cmms_uploads:
             story += self._cmms_section(cmms_uploads, styles)
         story += self._blind_spot_section(scoring, styles)
         story += self._priority_fixes_section(assessment_id, styles)
-        story += self._roadmap_section(domain_rollup, styles)
+        story += self._roadmap_section(ranked, styles)
         story += self._evidence_section(assessment_id, scoring, styles)
 
-        doc.build(story, onFirstPage=self._page_furniture, onLaterPages=self._page_furniture)
+        # Built in memory; the file is written once, atomically, at the end.
+        pdf = _render_pdf(
+            story,
+            f"RMI Executive Report — {a.client_name} {a.site_name}",
+            (settings.FIRM_NAME, settings.REPORT_CONFIDENTIAL_LABEL,
+             settings.FIRM_WEBSITE, settings.BRAND_PRIMARY_HEX),
+        )
+        write_report_file(filepath, pdf)
 
         registry = Report(
             assessment_id=assessment_id,
@@ -244,66 +455,20 @@ class ReportGeneratorV2:
                 "pillars": {k: v["score"] for k, v in pillar_rollup.items()},
             },
             file_path=filepath,
+            content_hash=content_hash,
             generated_by=generated_by,
         )
         self.db.add(registry)
         self.db.commit()
         return filepath
 
-    # ------------------------------------------------------------------
-    # Page furniture (header + footer + page numbers)
-    # ------------------------------------------------------------------
-
-    def _page_furniture(self, canvas, doc) -> None:
-        canvas.saveState()
-        w, h = letter
-        # Header rule + firm name
-        canvas.setStrokeColor(self.PRIMARY)
-        canvas.setLineWidth(0.75)
-        canvas.line(0.85 * inch, h - 0.6 * inch, w - 0.85 * inch, h - 0.6 * inch)
-        canvas.setFont("Helvetica-Bold", 8)
-        canvas.setFillColor(self.PRIMARY)
-        canvas.drawString(0.85 * inch, h - 0.52 * inch, settings.FIRM_NAME.upper())
-        canvas.setFont("Helvetica", 7.5)
-        canvas.setFillColor(self.MID)
-        canvas.drawRightString(w - 0.85 * inch, h - 0.52 * inch,
-                               "Reliability Maturity Index — Executive Audit")
-        # Footer
-        canvas.setStrokeColor(colors.HexColor("#D8E0DC"))
-        canvas.setLineWidth(0.5)
-        canvas.line(0.85 * inch, 0.62 * inch, w - 0.85 * inch, 0.62 * inch)
-        canvas.setFont("Helvetica", 7)
-        canvas.setFillColor(self.MID)
-        canvas.drawString(0.85 * inch, 0.46 * inch, settings.REPORT_CONFIDENTIAL_LABEL)
-        canvas.drawCentredString(w / 2.0, 0.46 * inch, settings.FIRM_WEBSITE)
-        canvas.drawRightString(w - 0.85 * inch, 0.46 * inch, f"Page {doc.page}")
-        canvas.restoreState()
-
     # ------------------------------------------------------------------
     # Styles
     # ------------------------------------------------------------------
 
     def _styles(self) -> dict:
-        base = getSampleStyleSheet()
-        return {
-            "title": ParagraphStyle("Title", parent=base["Heading1"], fontSize=26,
-                                    textColor=self.PRIMARY, alignment=TA_CENTER, leading=30,
-                                    spaceAfter=6),
-            "subtitle": ParagraphStyle("Subtitle", parent=base["Normal"], fontSize=13,
-                                       textColor=self.DARK, alignment=TA_CENTER, leading=18),
-            "h2": ParagraphStyle("H2", parent=base["Heading2"], fontSize=15,
-                                 textColor=self.PRIMARY, spaceBefore=14, spaceAfter=6),
-            "h3": ParagraphStyle("H3", parent=base["Heading3"], fontSize=11.5,
-                                 textColor=self.DARK, spaceBefore=8, spaceAfter=4),
-            "body": ParagraphStyle("Body", parent=base["BodyText"], fontSize=9.5,
-                                   textColor=self.DARK, leading=14, alignment=TA_LEFT),
-            "small": ParagraphStyle("Small", parent=base["BodyText"], fontSize=8,
-                                    textColor=self.MID, leading=11),
-            "callout": ParagraphStyle("Callout", parent=base["BodyText"], fontSize=10,
-                                      textColor=self.DARK, leading=15, backColor=self.BG,
-                                      borderColor=self.ACCENT, borderWidth=0, borderPadding=10,
-                                      leftIndent=6, rightIndent=6, spaceAfter=8),
-        }
+        return _paragraph_styles(settings.BRAND_PRIMARY_HEX, settings.BRAND_DARK_HEX,
+                                 settings.BRAND_ACCENT_HEX)
 
     # ------------------------------------------------------------------
     # Rollups
@@ -556,23 +721,18 @@ class ReportGeneratorV2:
             story.append(KeepTogether([radar]))
         return story
 
-    def _subdomain_section(self, assessment_id: int, st) -> list:
-        rows_q = (
-            self.db.query(SubdomainScore, Subdomain, Domain)
-            .join(Subdomain, SubdomainScore.subdomain_id == Subdomain.id)
-            .join(Domain, Subdomain.domain_id == Domain.id)
-            .filter(SubdomainScore.assessment_id == assessment_id)
-            .order_by(Domain.display_order, Subdomain.display_order)
-            .all()
-        )
+    def _subdomain_section(self, domain_rollup, st) -> list:
+        # Reuses the rows _domain_rollup already fetched (same join, same order)
+        # rather than querying SubdomainScore/Subdomain/Domain a second time.
         story = [Paragraph("Subdomain Detail", st["h3"])]
         rows = [["Code", "Subdomain", "Score", "Notes"]]
-        for sc, sd, dom in rows_q:
-            note = "—"
-            if getattr(sc, "cap_applied", False):
-                note = (getattr(sc, "cap_reason", None) or "Capped")[:54]
-            rows.append([sd.code, f"{sd.name}",
-                         f"{(sc.final_score or 0):.2f}", note])
+        for data in domain_rollup.values():
+            for sub in data["subdomains"]:
+                note = "—"
+                if sub["cap_applied"]:
+                    note = (sub["cap_reason"] or "Capped")[:54]
+                rows.append([sub["code"], f"{sub['name']}",
+                             f"{(sub['score'] or 0):.2f}", note])
         t = Table(rows, colWidths=[0.7 * inch, 2.5 * inch, 0.7 * inch, 2.4 * inch])
         t.setStyle(TableStyle([
             ("BACKGROUND", (0, 0), (-1, 0), self.DARK),
@@ -587,38 +747,24 @@ class ReportGeneratorV2:
         story.append(t)
         return story
 
-    def _findings_section(self, domain_rollup, scoring, st) -> list:
+    def _findings_section(self, ranked, scoring, st) -> list:
         story = [Paragraph("Key Findings", st["h2"]),
                  HRFlowable(width="100%", thickness=0.5, color=self.PRIMARY, spaceAfter=8)]
-        findings: List[str] = []
-        ordered = sorted(
-            [(c, d) for c, d in domain_rollup.items() if d["score"] is not None],
-            key=lambda x: x[1]["score"])
-        for code, data in ordered:
-            s = data["score"]
-            if s < 2.5:
-                findings.append(f"<b>{code} — {data['name']} ({s:.2f}):</b> Critical gap. "
-                                f"Foundational practices are absent or inconsistent; immediate "
-                                f"intervention is required to arrest reliability risk.")
-            elif s < 3.5:
-                findings.append(f"<b>{code} — {data['name']} ({s:.2f}):</b> Emerging. Practices "
-                                f"exist but are not yet systematic; targeted improvement will "
-                                f"move this domain to a proactive footing.")
-            elif s < 4.3:
-                findings.append(f"<b>{code} — {data['name']} ({s:.2f}):</b> Solid proactive "
-                                f"foundation; well positioned to advance toward predictive and "
-                                f"prescriptive practice.")
-            else:
-                findings.append(f"<b>{code} — {data['name']} ({s:.2f}):</b> Best-in-class. Focus "
-                                f"on sustainment, knowledge transfer, and continuous improvement.")
+        findings: List[str] = [
+            f"<b>{code} — {data['name']} ({data['score']:.2f}):</b> "
+            f"{_FINDING_TEXT[bisect_right(_FINDING_BOUNDS, data['score'])]}"
+            for code, data in ranked
+        ]
         caps = scoring.get("caps_applied") or []
         cap_labels = sorted({c.get("label") for c in caps if c.get("label")})
         for label in cap_labels[:6]:
             findings.append(f"<b>Weakest-link constraint:</b> {label}. This evidence-based cap "
                             f"limits the affected score until the gap is closed.")
-        for f in findings:
-            story.append(Paragraph(f"•&nbsp; {f}", st["body"]))
-            story.append(Spacer(1, 4))
+        # One flowable for the whole list: each Paragraph is a separate parse
+        # and layout pass, and a long Paragraph still splits across pages.
+        if findings:
+            story.append(Paragraph("<br/><br/>".join(f"•&nbsp; {f}" for f in findings),
+                                   st["body"]))
         return story
 
     def _cmms_section(self, cmms_uploads, st) -> list:
@@ -697,6 +843,7 @@ class ReportGeneratorV2:
         (3.0) floor; returns nothing if the site has no weak items."""
         from models_v2 import ResponseV2, QuestionV2, Subdomain, Domain, Practice
 
+        LOW_THRESHOLD = 3.0
         rows = (
             self.db.query(
                 ResponseV2.numeric_score, QuestionV2.question_code, QuestionV2.question_text,
@@ -708,7 +855,9 @@ class ReportGeneratorV2:
             .join(Domain, Subdomain.domain_id == Domain.id)
             .filter(
                 ResponseV2.assessment_id == assessment_id,
-                ResponseV2.numeric_score.isnot(None),
+                # Only sub-floor items are ever listed, so filter in SQL rather
+                # than shipping every scored response back to Python.
+                ResponseV2.numeric_score < LOW_THRESHOLD,
                 ResponseV2.is_na == False,      # noqa: E712
                 ResponseV2.is_draft == False,   # noqa: E712
             )
@@ -743,16 +892,12 @@ class ReportGeneratorV2:
                 "subdomain": sdname, "fix": fix,
             })
 
-        LOW_THRESHOLD = 3.0
         PER_DOMAIN = 3
 
         body: list = []
         for code in sorted(domains, key=lambda c: domains[c]["order"]):
             d = domains[code]
-            weak = [w for w in sorted(d["items"], key=lambda x: x["score"])
-                    if w["score"] < LOW_THRESHOLD][:PER_DOMAIN]
-            if not weak:
-                continue
+            weak = heapq.nsmallest(PER_DOMAIN, d["items"], key=lambda x: x["score"])
             body.append(Paragraph(f"{code} — {d['name']}", st["h3"]))
             table_rows = [["Lowest-scoring item", "Score", "Recommended action"]]
             for w in weak:
@@ -780,9 +925,6 @@ class ReportGeneratorV2:
             body.append(t)
             body.append(Spacer(1, 8))
 
-        if not body:
-            return []
-
         return [
             PageBreak(),
             Paragraph("Priority Fixes — Lowest-Scoring Items", st["h2"]),
@@ -793,30 +935,26 @@ class ReportGeneratorV2:
             Spacer(1, 10),
         ] + body
 
-    def _roadmap_section(self, domain_rollup, st) -> list:
+    def _roadmap_section(self, ranked, st) -> list:
         story = [PageBreak(), Paragraph("Strategic Roadmap (30 / 60 / 90 Day)", st["h2"]),
                  HRFlowable(width="100%", thickness=0.5, color=self.PRIMARY, spaceAfter=8)]
-        ordered = sorted(
-            [(c, d) for c, d in domain_rollup.items() if d["score"] is not None],
-            key=lambda x: x[1]["score"])
-        weakest = [c for c, _ in ordered[:3]] or list(DOMAIN_ROADMAP.keys())[:3]
-        if ordered:
+        lowest = ranked[:3]
+        weakest = [c for c, _ in lowest] or list(DOMAIN_ROADMAP.keys())[:3]
+        if lowest:
             story.append(Paragraph(
                 f"<b>Strategic priority:</b> concentrate first on "
                 f"{', '.join(weakest)} — the lowest-scoring domains — while sustaining strengths.",
                 st["callout"]))
-        phases = [("First 30 Days — Quick Wins", "30"),
-                  ("Days 31–60 — Capability Building", "60"),
-                  ("Days 61–90 — Strategic Initiatives", "90")]
-        for title, key in phases:
+        for title, key in ROADMAP_PHASES:
             actions: List[str] = []
             for code in weakest:
-                actions.extend(DOMAIN_ROADMAP.get(code, {}).get(key, []))
+                actions.extend(DOMAIN_ROADMAP.get(code, {}).get(key, ()))
             if not actions:
                 continue
             story.append(Paragraph(f"{title} — {len(actions)} actions", st["h3"]))
-            for i, act in enumerate(actions, 1):
-                story.append(Paragraph(f"<b>{i}.</b> {act}", st["body"]))
+            story.append(Paragraph(
+                "<br/>".join(f"<b>{i}.</b> {act}" for i, act in enumerate(actions, 1)),
+                st["body"]))
             story.append(Spacer(1, 6))
         story.append(Paragraph(
             "Assign an executive sponsor per phase, establish a weekly cadence, and re-baseline "
@@ -825,14 +963,18 @@ class ReportGeneratorV2:
 
     def _evidence_section(self, assessment_id, scoring, st) -> list:
         from models_v2 import EvidenceStatus
-        rows = self.db.query(ResponseV2).filter(
-            ResponseV2.assessment_id == assessment_id).all()
-        if not rows:
+        # Only the per-status counts are shown, so let the DB do the counting.
+        counts = (
+            self.db.query(ResponseV2.evidence_status, func.count(ResponseV2.id))
+            .filter(ResponseV2.assessment_id == assessment_id)
+            .group_by(ResponseV2.evidence_status)
+            .all()
+        )
+        if not counts:
             return []
-        buckets: Dict[str, int] = {}
-        for r in rows:
-            key = r.evidence_status.value if r.evidence_status else "unknown"
-            buckets[key] = buckets.get(key, 0) + 1
+        buckets: Dict[str, int] = {
+            (status.value if status else "unknown"): n for status, n in counts
+        }
         order = [
             (EvidenceStatus.ACCEPTED.value, "Verified (Accepted)"),
             (EvidenceStatus.PENDING_VERIFICATION.value, "Submitted, pending verification"),
@@ -865,42 +1007,59 @@ class ReportGeneratorV2:
         return story
 
     # ------------------------------------------------------------------
-    # Radar chart (in-memory, no temp file)
+    # Radar chart (native vector Drawing — no matplotlib, no raster)
     # ------------------------------------------------------------------
 
     def _radar(self, labels: List[str], values: List[float],
                benchmark_values: Optional[List[float]] = None,
                benchmark_label: str = "Benchmark",
-               title: str = "Maturity Profile") -> Optional[Image]:
+               title: str = "Maturity Profile") -> Optional[Drawing]:
         if not labels:
             return None
-        angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
-        vals = list(values) + values[:1]
-        ang = angles + angles[:1]
-        primary = settings.BRAND_PRIMARY_HEX
-
-        fig = plt.figure(figsize=(6, 5.2))
-        ax = plt.subplot(111, polar=True)
-        ax.set_facecolor("#FBFCFB")
+        n = len(labels)
+        width, height = 4.8 * inch, 4.2 * inch
+        cx, cy = width / 2.0, height / 2.0 - 12
+        radius = min(width, height) * 0.32
+        grid = colors.HexColor("#E0E6E3")
+        muted = colors.HexColor("#9AA5A1")
+
+        def points(vals) -> List[float]:
+            return _radar_vertices(vals, cx, cy, radius).tolist()
+
+        d = Drawing(width, height)
+        for ring in range(1, 6):
+            d.add(Polygon(points([ring] * n), fillColor=None, strokeColor=grid,
+                          strokeWidth=0.5, strokeDashArray=[2, 2]))
+            d.add(String(cx + 3, cy + ring / 5.0 * radius + 2, str(ring),
+                         fontName="Helvetica", fontSize=7, fillColor=self.MID))
+        outer = points([5] * n)
+        label_pts = points([5.75] * n)
+        for i, label in enumerate(labels):
+            d.add(Line(cx, cy, outer[2 * i], outer[2 * i + 1], strokeColor=grid, strokeWidth=0.5))
+            lx, ly = label_pts[2 * i], label_pts[2 * i + 1]
+            anchor = "middle" if abs(lx - cx) < 8 else ("start" if lx > cx else "end")
+            d.add(String(lx, ly - 3, label, textAnchor=anchor, fontName="Helvetica-Bold",
+                         fontSize=9, fillColor=self.DARK))
+
+        if benchmark_values:
+            d.add(Polygon(points(benchmark_values), fillColor=muted, fillOpacity=0.08,
+                          strokeColor=muted, strokeWidth=1.1, strokeDashArray=[4, 3]))
+        site = points(values)
+        d.add(Polygon(site, fillColor=self.PRIMARY, fillOpacity=0.18,
+                      strokeColor=self.PRIMARY, strokeWidth=2))
+        for i in range(n):
+            d.add(Circle(site[2 * i], site[2 * i + 1], 3, fillColor=colors.white,
+                         strokeColor=self.PRIMARY, strokeWidth=1.4))
+
+        d.add(String(width / 2.0, height - 12, title, textAnchor="middle",
+                     fontName="Helvetica-Bold", fontSize=11, fillColor=colors.HexColor("#14302B")))
+        legend = [("This site", self.PRIMARY, None)]
         if benchmark_values:
-            bvals = list(benchmark_values) + benchmark_values[:1]
-            ax.plot(ang, bvals, linestyle="--", linewidth=1.3, color="#9AA5A1",
-                    label=benchmark_label, zorder=1)
-            ax.fill(ang, bvals, color="#9AA5A1", alpha=0.08, zorder=1)
-        ax.plot(ang, vals, "o-", linewidth=2.3, color=primary, markersize=6,
-                markerfacecolor="white", markeredgecolor=primary, markeredgewidth=1.6,
-                label="This site", zorder=2)
-        ax.fill(ang, vals, color=primary, alpha=0.18, zorder=2)
-        ax.set_xticks(angles)
-        ax.set_xticklabels(labels, size=10, weight="bold")
-        ax.set_yticks([1, 2, 3, 4, 5])
-        ax.set_yticklabels(["1", "2", "3", "4", "5"], size=8, color="#6B7670")
-        ax.set_ylim(0, 5)
-        ax.grid(color="#E0E6E3", linestyle="--", linewidth=0.5)
-        ax.set_title(title, size=12, weight="bold", pad=18, color="#14302B")
-        ax.legend(loc="upper right", bbox_to_anchor=(1.18, 1.12), frameon=False, fontsize=8)
-        buf = io.BytesIO()
-        plt.savefig(buf, format="PNG", dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        buf.seek(0)
-        return Image(buf, width=4.8 * inch, height=4.2 * inch)
+            legend.append((benchmark_label, muted, [4, 3]))
+        for row, (text, color, dash) in enumerate(legend):
+            y = height - 28 - row * 11
+            d.add(Line(width - 118, y + 2.5, width - 104, y + 2.5, strokeColor=color,
+                       strokeWidth=1.6, strokeDashArray=dash))
+            d.add(String(width - 100, y, text, fontName="Helvetica", fontSize=7,
+                         fillColor=self.MID))
+        return d
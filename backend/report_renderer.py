@@ -12,15 +12,19 @@ download never hard-fails.
 from __future__ import annotations
 
 import base64
+import heapq
+import io
 import logging
 import math
 import os
 import re
 import tempfile
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from typing import Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from config import settings
@@ -29,6 +33,7 @@ from models_v2 import (
     AssessmentV2, CMMSUploadV2, Domain, Practice, QuestionV2, ResponseV2,
     Subdomain, SubdomainScore, EvidenceStatus, TargetRoleV2,
 )
+from report_cache import find_cached_report, report_content_hash, write_report_file
 from scoring_engine_v2 import ScoringEngineV2
 
 logger = logging.getLogger(__name__)
@@ -55,50 +60,70 @@ INDUSTRY_NAMES = {
     "MNM": "Mining & Minerals", "UTL": "Utilities", "PHA": "Pharmaceuticals",
 }
 DOMAIN_ROADMAP = {
-    "WC": {"30": ["Run a skills-matrix gap analysis for all maintenance roles",
-                  "Launch weekly reliability toolbox talks"],
-           "60": ["Stand up a competency-based training program with certification paths",
-                  "Formalize knowledge-transfer pairing (senior to junior technicians)"],
-           "90": ["Establish a Reliability Technician certification track and career ladder"]},
-    "LC": {"30": ["Publish and brief stop-work authority and safety expectations",
-                  "Hold a leadership reliability alignment session"],
-           "60": ["Define reliability KPIs reviewed by leadership on a fixed cadence",
-                  "Clarify maintenance org structure and accountability (RACI)"],
-           "90": ["Embed a proactive reliability culture program with frontline ownership"]},
-    "WM": {"30": ["Audit the last 100 work orders for planning/execution quality",
-                  "Create standardized job plans for the top 20 critical PM tasks"],
-           "60": ["Deploy a planner-approved work-order planning checklist",
-                  "Run PM optimization (RCM/PMO) on critical assets; manage backlog by priority"],
-           "90": ["Institute a 2-week forward schedule with schedule-compliance KPIs"]},
-    "AI": {"30": ["Audit CMMS data quality (closure codes, failure modes, completeness)",
-                  "Stand up a Top-10 bad-actor dashboard by downtime"],
-           "60": ["Align failure taxonomy to ISO 14224; enforce mandatory WO fields",
-                  "Enable mobile CMMS capture for field technicians"],
-           "90": ["Launch a predictive-maintenance pilot and a leadership reliability dashboard"]},
-    "SG": {"30": ["Draft/ratify a written asset-management policy and objectives",
-                  "Define the reliability metric set (leading + lagging)"],
-           "60": ["Stand up monthly performance reviews against AM objectives",
-                  "Establish a continuous-improvement (RCA to action) loop"],
-           "90": ["Mature toward ISO 55001 alignment with an audited management system"]},
+    "WC": {"30": ("Run a skills-matrix gap analysis for all maintenance roles",
+                  "Launch weekly reliability toolbox talks"),
+           "60": ("Stand up a competency-based training program with certification paths",
+                  "Formalize knowledge-transfer pairing (senior to junior technicians)"),
+           "90": ("Establish a Reliability Technician certification track and career ladder",)},
+    "LC": {"30": ("Publish and brief stop-work authority and safety expectations",
+                  "Hold a leadership reliability alignment session"),
+           "60": ("Define reliability KPIs reviewed by leadership on a fixed cadence",
+                  "Clarify maintenance org structure and accountability (RACI)"),
+           "90": ("Embed a proactive reliability culture program with frontline ownership",)},
+    "WM": {"30": ("Audit the last 100 work orders for planning/execution quality",
+                  "Create standardized job plans for the top 20 critical PM tasks"),
+           "60": ("Deploy a planner-approved work-order planning checklist",
+                  "Run PM optimization (RCM/PMO) on critical assets; manage backlog by priority"),
+           "90": ("Institute a 2-week forward schedule with schedule-compliance KPIs",)},
+    "AI": {"30": ("Audit CMMS data quality (closure codes, failure modes, completeness)",
+                  "Stand up a Top-10 bad-actor dashboard by downtime"),
+           "60": ("Align failure taxonomy to ISO 14224; enforce mandatory WO fields",
+                  "Enable mobile CMMS capture for field technicians"),
+           "90": ("Launch a predictive-maintenance pilot and a leadership reliability dashboard",)},
+    "SG": {"30": ("Draft/ratify a written asset-management policy and objectives",
+                  "Define the reliability metric set (leading + lagging)"),
+           "60": ("Stand up monthly performance reviews against AM objectives",
+                  "Establish a continuous-improvement (RCA to action) loop"),
+           "90": ("Mature toward ISO 55001 alignment with an audited management system",)},
 }
 
+ROADMAP_PHASES = (
+    ("30", "First 30 Days — Quick Wins"),
+    ("60", "Days 31–60 — Capability Building"),
+    ("90", "Days 61–90 — Strategic Initiatives"),
+)
+
 
 def _slug(name: str) -> str:
     return _FILENAME_RE.sub("_", name or "").strip("._-") or "unknown"
 
 
+# Same bands as report_generator_v2: bisect_right on the lower bounds of
+# levels 2–5. The dicts are shared; templates only read them.
+_LEVEL_BOUNDS = (2.0, 3.0, 3.6, 4.3)
+_LEVELS = (
+    {"n": 1, "label": "Reactive", "color": "#C0392B"},
+    {"n": 2, "label": "Emerging", "color": "#D9822B"},
+    {"n": 3, "label": "Systematic", "color": ACCENT},
+    {"n": 4, "label": "Proactive", "color": "#2E8C6A"},
+    {"n": 5, "label": "Prescriptive", "color": "#1E7A52"},
+)
+_NOT_SCORED = {"n": 0, "label": "Not scored", "color": SILVER}
+
+# Key-findings narrative per domain band: < 2.5, [2.5, 3.5), [3.5, 4.3), ≥ 4.3.
+_FINDING_BOUNDS = (2.5, 3.5, 4.3)
+_FINDING_TEXT = (
+    "Critical gap. Foundational practices are absent or inconsistent; immediate intervention is required.",
+    "Emerging. Practices exist but are not yet systematic; targeted improvement moves this to a proactive footing.",
+    "Solid proactive foundation; well positioned to advance toward predictive and prescriptive practice.",
+    "Best-in-class. Focus on sustainment, knowledge transfer, and continuous improvement.",
+)
+
+
 def _level(score: Optional[float]) -> dict:
     if score is None:
-        return {"n": 0, "label": "Not scored", "color": SILVER}
-    if score < 2.0:
-        return {"n": 1, "label": "Reactive", "color": "#C0392B"}
-    if score < 3.0:
-        return {"n": 2, "label": "Emerging", "color": "#D9822B"}
-    if score < 3.6:
-        return {"n": 3, "label": "Systematic", "color": ACCENT}
-    if score < 4.3:
-        return {"n": 4, "label": "Proactive", "color": "#2E8C6A"}
-    return {"n": 5, "label": "Prescriptive", "color": "#1E7A52"}
+        return _NOT_SCORED
+    return _LEVELS[bisect_right(_LEVEL_BOUNDS, score)]
 
 
 def _data_uri(path: str) -> str:
@@ -125,6 +150,11 @@ class HTMLReportRenderer:
         if not a:
             raise ValueError(f"Assessment {assessment_id} not found")
 
+        content_hash = report_content_hash(self.db, a, "executive_v2_html")
+        cached = find_cached_report(self.db, assessment_id, content_hash)
+        if cached:
+            return cached
+
         ctx = self._build_context(a)
         fonts_css = self._read(os.path.join(_TPL_DIR, "_fonts.css"))
         serif_css = self._read(os.path.join(_TPL_DIR, "_serif.css"))
@@ -145,7 +175,7 @@ class HTMLReportRenderer:
             assessment_id=assessment_id, report_type="executive_v2_html",
             title=f"Executive RMI Report — {a.client_name} {a.site_name}",
             content={"overall_rmi": ctx["overall"], "engine": "html"},
-            file_path=filepath, generated_by=generated_by,
+            file_path=filepath, content_hash=content_hash, generated_by=generated_by,
         )
         self.db.add(registry)
         self.db.commit()
@@ -157,42 +187,38 @@ class HTMLReportRenderer:
 
         footer = self._footer_template(ctx)
         header = self._header_template(ctx)
-        tmp_cover = filepath + ".cover.pdf"
-        tmp_body = filepath + ".body.pdf"
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    args=["--no-sandbox", "--disable-dev-shm-usage", "--font-render-hinting=none"]
-                )
-                ctx_b = browser.new_context()
-                # Cover: full bleed
-                pc = ctx_b.new_page()
-                pc.set_content(cover_html, wait_until="load")
-                pc.pdf(path=tmp_cover, format="Letter", print_background=True,
-                       margin={"top": "0", "bottom": "0", "left": "0", "right": "0"})
-                pc.close()
-                # Body: margins + running header/footer + page numbers
-                pb = ctx_b.new_page()
-                pb.set_content(body_html, wait_until="load")
-                pb.pdf(path=tmp_body, format="Letter", print_background=True,
-                       display_header_footer=True, header_template=header, footer_template=footer,
-                       margin={"top": "0.7in", "bottom": "0.62in", "left": "0.7in", "right": "0.7in"})
-                pb.close()
-                browser.close()
-
-            from pypdf import PdfReader, PdfWriter
-            writer = PdfWriter()
-            for part in (tmp_cover, tmp_body):
-                for page in PdfReader(part).pages:
-                    writer.add_page(page)
-            with open(filepath, "wb") as f:
-                writer.write(f)
-        finally:
-            for t in (tmp_cover, tmp_body):
-                try:
-                    os.remove(t)
-                except OSError:
-                    pass
+        # page.pdf() without a path returns the PDF bytes, so both parts stay
+        # in memory: no sidecar temp files for concurrent renders to collide on.
+        with sync_playwright() as p:
+            browser = p.chromium.launch(
+                args=["--no-sandbox", "--disable-dev-shm-usage", "--font-render-hinting=none"]
+            )
+            ctx_b = browser.new_context()
+            # Cover: full bleed
+            pc = ctx_b.new_page()
+            pc.set_content(cover_html, wait_until="load")
+            cover_pdf = pc.pdf(format="Letter", print_background=True,
+                               margin={"top": "0", "bottom": "0", "left": "0", "right": "0"})
+            pc.close()
+            # Body: margins + running header/footer + page numbers
+            pb = ctx_b.new_page()
+            pb.set_content(body_html, wait_until="load")
+            body_pdf = pb.pdf(format="Letter", print_background=True,
+                              display_header_footer=True, header_template=header,
+                              footer_template=footer,
+                              margin={"top": "0.7in", "bottom": "0.62in",
+                                      "left": "0.7in", "right": "0.7in"})
+            pb.close()
+            browser.close()
+
+        from pypdf import PdfReader, PdfWriter
+        writer = PdfWriter()
+        for part in (cover_pdf, body_pdf):
+            for page in PdfReader(io.BytesIO(part)).pages:
+                writer.add_page(page)
+        merged = io.BytesIO()
+        writer.write(merged)
+        write_report_file(filepath, merged.getvalue())
 
     def _header_template(self, ctx: dict) -> str:
         # No running header — the McKinsey-style layout keeps the top of each
@@ -225,10 +251,13 @@ class HTMLReportRenderer:
             scoring = {}
 
         domain_rollup = self._domain_rollup(a.id)
+        # Scored domains, weakest first. The fallback overall, findings, the
+        # below-floor count and the roadmap focus all read this one sort.
+        ranked = sorted((d for d in domain_rollup if d["score"] is not None),
+                        key=lambda x: x["score"])
         overall = a.overall_rmi
-        if overall is None and domain_rollup:
-            vals = [d["score"] for d in domain_rollup if d["score"] is not None]
-            overall = round(sum(vals) / len(vals), 2) if vals else None
+        if overall is None and ranked:
+            overall = round(sum(d["score"] for d in ranked) / len(ranked), 2)
 
         pillars = self._pillars(domain_rollup)
         benchmark = self._benchmark(a.id)
@@ -260,19 +289,19 @@ class HTMLReportRenderer:
             # against world-class, not the floor.
             "floor": 3.0, "target": 4.0, "world": 5.0,
             "overall_gap": round(5.0 - overall, 2) if overall is not None else None,
-            "below_floor": len([d for d in domain_rollup if d["score"] is not None and d["score"] < 3.0]),
+            "below_floor": bisect_left([d["score"] for d in ranked], 3.0),
             "confidence": round((scoring.get("confidence") or 0) * 100) if scoring.get("confidence") is not None else None,
             "confidence_band": scoring.get("confidence_band") or [None, None],
             "iso_readiness": round((scoring.get("iso_55001_readiness") or 0) * 100) if scoring.get("iso_55001_readiness") is not None else None,
             "responses": responses,
             "domains": domain_rollup,
             "pillars": pillars,
-            "findings": self._findings(domain_rollup, scoring),
+            "findings": self._findings(ranked, scoring),
             "priority_fixes": self._priority_fixes(a.id),
             "cmms": self._cmms(a.id),
             "blind_spots": scoring.get("blind_spots") or [],
             "velocity": scoring.get("velocity") or {},
-            "roadmap": self._roadmap(domain_rollup),
+            "roadmap": self._roadmap(ranked),
             "evidence": self._evidence(a.id),
             "ops_alignment": self._ops_alignment(a.id),
             "benchmark": benchmark,
@@ -330,22 +359,12 @@ class HTMLReportRenderer:
         except Exception:
             return None
 
-    def _findings(self, domain_rollup, scoring) -> List[str]:
-        out = []
-        for d in sorted([x for x in domain_rollup if x["score"] is not None], key=lambda x: x["score"]):
-            s = d["score"]
-            if s < 2.5:
-                out.append(f"<b>{d['code']} — {d['name']} ({s:.2f}):</b> Critical gap. Foundational "
-                           f"practices are absent or inconsistent; immediate intervention is required.")
-            elif s < 3.5:
-                out.append(f"<b>{d['code']} — {d['name']} ({s:.2f}):</b> Emerging. Practices exist but "
-                           f"are not yet systematic; targeted improvement moves this to a proactive footing.")
-            elif s < 4.3:
-                out.append(f"<b>{d['code']} — {d['name']} ({s:.2f}):</b> Solid proactive foundation; well "
-                           f"positioned to advance toward predictive and prescriptive practice.")
-            else:
-                out.append(f"<b>{d['code']} — {d['name']} ({s:.2f}):</b> Best-in-class. Focus on sustainment, "
-                           f"knowledge transfer, and continuous improvement.")
+    def _findings(self, ranked, scoring) -> List[str]:
+        out = [
+            f"<b>{d['code']} — {d['name']} ({d['score']:.2f}):</b> "
+            f"{_FINDING_TEXT[bisect_right(_FINDING_BOUNDS, d['score'])]}"
+            for d in ranked
+        ]
         for label in sorted({c.get("label") for c in (scoring.get("caps_applied") or []) if c.get("label")})[:5]:
             out.append(f"<b>Weakest-link constraint:</b> {label}.")
         return out
@@ -359,7 +378,7 @@ class HTMLReportRenderer:
             .join(Subdomain, QuestionV2.subdomain_id == Subdomain.id)
             .join(Domain, Subdomain.domain_id == Domain.id)
             .filter(ResponseV2.assessment_id == assessment_id,
-                    ResponseV2.numeric_score.isnot(None),
+                    ResponseV2.numeric_score < 3.0,  # only sub-floor items are listed
                     ResponseV2.is_na == False, ResponseV2.is_draft == False)  # noqa: E712
             .all()
         )
@@ -387,9 +406,8 @@ class HTMLReportRenderer:
                                "text": (qtext or "")[:120], "level": _level(float(score)), "fix": fix})
         out = []
         for g in sorted(groups.values(), key=lambda x: x["order"]):
-            weak = [w for w in sorted(g["rows"], key=lambda x: x["score"]) if w["score"] < 3.0][:4]
-            if weak:
-                out.append({"code": g["code"], "name": g["name"], "rows": weak})
+            weak = heapq.nsmallest(4, g["rows"], key=lambda x: x["score"])
+            out.append({"code": g["code"], "name": g["name"], "rows": weak})
         return out
 
     def _cmms(self, assessment_id: int) -> List[dict]:
@@ -415,25 +433,24 @@ class HTMLReportRenderer:
                         "bad_actors": (u.bad_actors or [])[:5]})
         return out
 
-    def _roadmap(self, domain_rollup) -> dict:
-        ordered = sorted([d for d in domain_rollup if d["score"] is not None], key=lambda x: x["score"])
-        weakest = [d["code"] for d in ordered[:3]] or list(DOMAIN_ROADMAP)[:3]
+    def _roadmap(self, ranked) -> dict:
+        weakest = [d["code"] for d in ranked[:3]] or list(DOMAIN_ROADMAP)[:3]
         phases = {}
-        for key, title in (("30", "First 30 Days — Quick Wins"),
-                           ("60", "Days 31–60 — Capability Building"),
-                           ("90", "Days 61–90 — Strategic Initiatives")):
+        for key, title in ROADMAP_PHASES:
             acts = []
             for c in weakest:
-                acts.extend(DOMAIN_ROADMAP.get(c, {}).get(key, []))
+                acts.extend(DOMAIN_ROADMAP.get(c, {}).get(key, ()))
             phases[key] = {"title": title, "actions": acts}
         return {"weakest": weakest, "phases": phases}
 
     def _evidence(self, assessment_id: int) -> List[dict]:
-        rows = self.db.query(ResponseV2).filter(ResponseV2.assessment_id == assessment_id).all()
-        buckets: Dict[str, int] = {}
-        for r in rows:
-            k = r.evidence_status.value if r.evidence_status else "unknown"
-            buckets[k] = buckets.get(k, 0) + 1
+        counts = (
+            self.db.query(ResponseV2.evidence_status, func.count(ResponseV2.id))
+            .filter(ResponseV2.assessment_id == assessment_id)
+            .group_by(ResponseV2.evidence_status)
+            .all()
+        )
+        buckets = {(status.value if status else "unknown"): n for status, n in counts}
         order = [(EvidenceStatus.ACCEPTED.value, "Verified (Accepted)"),
                  (EvidenceStatus.PENDING_VERIFICATION.value, "Submitted, pending verification"),
                  (EvidenceStatus.PENDING_EVIDENCE.value, "Awaiting evidence"),
@@ -4,13 +4,14 @@ Selects questions based on assessment mode (QuickScan / Standard / DeepDive),
 respondent role, and optional industry module.
 """
 import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from sqlalchemy.orm import Session
 
 from models_v2 import (
     QuestionV2, Subdomain, Domain, AssessmentV2,
     AssessmentMode, TargetRoleV2, IndustryModule
 )
+from question_bank_v2 import QuestionDTO, get_questions_by_subdomain, iter_active_questions
 
 
 class RoutingEngine:
@@ -73,7 +74,7 @@ class RoutingEngine:
 
     # ── Mode membership (robust to JSON-column quirks) ──
     @staticmethod
-    def _modes_of(q: QuestionV2) -> set:
+    def _modes_of(q: Union[QuestionV2, QuestionDTO]) -> set:
         """Return the lowercase mode tags for a question.
 
         ``assessment_modes`` has historically been written either as a JSON array
@@ -95,18 +96,9 @@ class RoutingEngine:
             modes = []
         return {str(m).strip().lower() for m in modes}
 
-    def _subdomain_candidates(self, sd_id: int) -> List[QuestionV2]:
+    def _subdomain_candidates(self, sd_id: int) -> List[QuestionDTO]:
         """Active questions for a subdomain, best-first (critical, then weight)."""
-        return (
-            self.db.query(QuestionV2)
-            .filter(QuestionV2.subdomain_id == sd_id, QuestionV2.is_active == True)
-            .order_by(
-                QuestionV2.is_critical.desc(),
-                QuestionV2.weight.desc(),
-                QuestionV2.question_code,
-            )
-            .all()
-        )
+        return get_questions_by_subdomain(self.db, sd_id)
 
     def _route_quickscan(self) -> List[Dict]:
         """One question per subdomain: the quickscan-tagged one (critical /
@@ -172,23 +164,13 @@ class RoutingEngine:
 
     def _route_deepdive(self, respondent_role: Optional[TargetRoleV2] = None) -> List[Dict]:
         """Active questions filtered by role, ordered by subdomain then question_code."""
-        query = (
-            self.db.query(QuestionV2)
-            .join(Subdomain)
-            .filter(QuestionV2.is_active == True)
-            .order_by(Subdomain.display_order, QuestionV2.question_code)
-        )
-
-        if respondent_role:
-            # Filter to only questions targeting this role
-            query = query.filter(QuestionV2.target_role == respondent_role)
-
-        ordered = query.all()
-
-        # Need subdomain info
+        # Need subdomain info (loaded before streaming the question rows)
         sd_map = {sd.id: sd for sd in self.db.query(Subdomain).all()}
 
-        return [self._format_question(q, sd_map.get(q.subdomain_id)) for q in ordered]
+        return [
+            self._format_question(q, sd_map.get(q.subdomain_id))
+            for q in iter_active_questions(self.db, respondent_role)
+        ]
 
     # ─────────────────────────────────────────
     #  Mode Transition
@@ -235,7 +217,8 @@ class RoutingEngine:
     #  Helpers
     # ─────────────────────────────────────────
 
-    def _format_question(self, q: QuestionV2, sd: Optional[Subdomain]) -> Dict:
+    def _format_question(self, q: Union[QuestionV2, QuestionDTO],
+                         sd: Optional[Subdomain]) -> Dict:
         """Format a question for API response."""
         rubric = q.scoring_rubric
         if isinstance(rubric, str):
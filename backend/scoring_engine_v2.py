@@ -3,11 +3,13 @@ RMI vNext Scoring Engine — v2
 Rebalanced maturity scale, evidence hard-reject, subdomain-level scoring,
 weakest-link rules, confidence bands, maturity velocity, and ISO 55001 gap analysis.
 """
+from sqlalchemy import and_, case, func, insert, or_, select
 from sqlalchemy.orm import Session
 from typing import Dict, List, Optional, Tuple
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
 from statistics import stdev, mean
-import json
 
 from models_v2 import (
     AssessmentV2, ResponseV2, QuestionV2, SubdomainScore,
@@ -26,13 +28,16 @@ class ScoringEngineV2:
     """
 
     # ── Role weights (sum = 1.00) ──
-    ROLE_WEIGHTS: Dict[str, float] = {
-        "TECHNICIAN":          0.35,
-        "SUPERVISOR":          0.20,
-        "MANAGER":             0.15,
-        "PLANNER":             0.15,
-        "RELIABILITY_ENGINEER": 0.15,
+    # Keyed by the enum member itself (a str enum, so "TECHNICIAN" lookups
+    # still work); unroled/unknown respondents weigh a neutral 0.20.
+    ROLE_WEIGHTS: Dict[TargetRoleV2, float] = {
+        TargetRoleV2.TECHNICIAN:           0.35,
+        TargetRoleV2.SUPERVISOR:           0.20,
+        TargetRoleV2.MANAGER:              0.15,
+        TargetRoleV2.PLANNER:              0.15,
+        TargetRoleV2.RELIABILITY_ENGINEER: 0.15,
     }
+    DEFAULT_ROLE_WEIGHT = 0.20
 
     # ── Maturity level boundaries ──
     # Contiguous half-open bands [low, high): every value in [1.0, 5.0] maps to
@@ -44,6 +49,9 @@ class ScoringEngineV2:
         (3.60, 4.30, 4, "Proactive"),
         (4.30, 5.01, 5, "Prescriptive"),  # high is exclusive; 5.01 includes 5.00
     ]
+    # Bisect form of the table above: interior band edges and one label per band.
+    _MATURITY_EDGES = tuple(low for low, _, _, _ in MATURITY_LEVELS[1:])
+    _MATURITY_LABELS = tuple(f"Level {num} - {name}" for _, _, num, name in MATURITY_LEVELS)
 
     # ── Default domain weights (equal) ──
     DEFAULT_DOMAIN_WEIGHTS: Dict[str, float] = {
@@ -86,6 +94,9 @@ class ScoringEngineV2:
     EVIDENCE_REQUIRED_FOR_SCORE_AT_OR_ABOVE = 4
     EVIDENCE_CAP_WITHOUT_ACCEPTED = 3.0
 
+    # Evidence grade multiplier (ungraded → 1.0)
+    EVIDENCE_GRADE_MULTIPLIERS: Dict[str, float] = {"A": 1.0, "B": 0.95, "C": 0.85, "D": 0.75}
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -114,16 +125,14 @@ class ScoringEngineV2:
         subdomains = self.db.query(Subdomain).order_by(Subdomain.display_order).all()
         subdomain_results: Dict[str, Dict] = {}
         caps_applied: List[Dict] = []
-        blind_spots: List[Dict] = []
 
+        # One grouped aggregate covers every subdomain.
+        scored = self._score_subdomains(assessment_id)
         for sd in subdomains:
-            result = self._score_subdomain(assessment_id, sd, assessment.assessment_mode)
-            subdomain_results[sd.code] = result
+            subdomain_results[sd.code] = scored.get(sd.id) or self._unscored_subdomain()
 
-            # Detect cultural blind spots
-            bs = self._detect_blind_spot(assessment_id, sd)
-            if bs:
-                blind_spots.append(bs)
+        # Detect cultural blind spots
+        blind_spots: List[Dict] = self._detect_blind_spots(assessment_id, subdomains)
 
         # ── Step 2: Apply critical-failure caps (question-level) ──
         caps_applied += self._apply_critical_caps(assessment_id, subdomain_results)
@@ -132,14 +141,21 @@ class ScoringEngineV2:
         caps_applied += self._apply_cmms_evidence_caps(assessment_id, subdomain_results)
 
         # ── Step 3: Aggregate to domain scores ──
+        # Group the subdomains already loaded in step 1 rather than lazy-loading
+        # dom.subdomains, which costs one round trip per domain.
+        domain_sd_codes: Dict[int, List[str]] = {}
+        for sd in subdomains:
+            domain_sd_codes.setdefault(sd.domain_id, []).append(sd.code)
         domain_results: Dict[str, Dict] = {}
-        domains = self.db.query(Domain).order_by(Domain.display_order).all()
-        for dom in domains:
-            sd_codes = [sd.code for sd in dom.subdomains]
+        domains = self.db.execute(
+            select(Domain.id, Domain.code).order_by(Domain.display_order)
+        ).all()
+        for dom_id, dom_code in domains:
+            sd_codes = domain_sd_codes.get(dom_id, [])
             sd_scores = [subdomain_results[c]["final_score"] for c in sd_codes
                          if subdomain_results[c]["final_score"] is not None]
             domain_score = mean(sd_scores) if sd_scores else None
-            domain_results[dom.code] = {
+            domain_results[dom_code] = {
                 "score": round(domain_score, 2) if domain_score is not None else None,
                 "subdomains": {c: subdomain_results[c] for c in sd_codes},
             }
@@ -212,81 +228,121 @@ class ScoringEngineV2:
     def _score_subdomain(self, assessment_id: int, sd: Subdomain,
                          mode: AssessmentMode) -> Dict:
         """Calculate weighted score for a single subdomain."""
-        responses = (
-            self.db.query(ResponseV2, QuestionV2)
-            .join(QuestionV2)
+        scored = self._score_subdomains(assessment_id, QuestionV2.subdomain_id == sd.id)
+        return scored.get(sd.id) or self._unscored_subdomain()
+
+    def _score_subdomains(self, assessment_id: int, *criteria) -> Dict[int, Dict]:
+        """Weighted scores keyed by subdomain id, for subdomains with responses."""
+        blocked = self._evidence_blocked_clause()
+        rows = (
+            self.db.query(QuestionV2.subdomain_id, *self._subdomain_aggregates())
+            .join(QuestionV2, ResponseV2.question_id == QuestionV2.id)
             .filter(
                 ResponseV2.assessment_id == assessment_id,
-                QuestionV2.subdomain_id == sd.id,
                 ResponseV2.is_draft == False,
                 ResponseV2.is_na == False,
+                *criteria,
             )
+            .group_by(QuestionV2.subdomain_id)
             .all()
         )
 
-        if not responses:
-            return {"raw_score": None, "final_score": None, "response_count": 0,
-                    "evidence_blocked": 0, "evidence_blocked_questions": [],
-                    "cap_applied": False, "cap_reason": None}
-
-        total_weighted = 0.0
-        total_weight = 0.0
-        evidence_blocked = 0
-        evidence_blocked_questions: List[Dict] = []
-
-        for resp, question in responses:
-            if resp.numeric_score is None:
-                continue
+        blocked_questions: Dict[int, List[Dict]] = {}
+        if any(row[4] for row in rows):
+            for sd_id, detail in self._evidence_blocked_questions(assessment_id, blocked, *criteria):
+                blocked_questions.setdefault(sd_id, []).append(detail)
+
+        results: Dict[int, Dict] = {}
+        for sd_id, response_count, total_weighted, total_weight, evidence_blocked in rows:
+            raw = total_weighted / total_weight if total_weight else None
+            results[sd_id] = {
+                "raw_score": round(raw, 2) if raw is not None else None,
+                "final_score": round(raw, 2) if raw is not None else None,  # caps applied later
+                "response_count": response_count,
+                "evidence_blocked": int(evidence_blocked or 0),
+                "evidence_blocked_questions": blocked_questions.get(sd_id, []),
+                "cap_applied": False,
+                "cap_reason": None,
+            }
+        return results
 
-            # ── Evidence policy ──
-            # If the question requires evidence and the response is at or above
-            # the evidence threshold, the score is soft-capped unless the
-            # evidence status is ACCEPTED. PENDING_VERIFICATION (uploaded but
-            # not yet verified) and REJECTED both fall back to the cap so
-            # claims do not lift maturity without a verified audit trail.
-            effective_score = float(resp.numeric_score)
-            claimed = effective_score
-            if (
-                question.evidence_required
-                and effective_score >= self.EVIDENCE_REQUIRED_FOR_SCORE_AT_OR_ABOVE
-                and resp.evidence_status != EvidenceStatus.ACCEPTED
-            ):
-                evidence_blocked += 1
-                effective_score = min(effective_score, self.EVIDENCE_CAP_WITHOUT_ACCEPTED)
-                evidence_blocked_questions.append({
-                    "question_id": question.id,
-                    "code": question.question_code,
-                    "claimed": claimed,
-                    "capped_to": effective_score,
-                    "evidence_status": (
-                        resp.evidence_status.value if resp.evidence_status else None
-                    ),
-                })
+    @staticmethod
+    def _unscored_subdomain() -> Dict:
+        return {"raw_score": None, "final_score": None, "response_count": 0,
+                "evidence_blocked": 0, "evidence_blocked_questions": [],
+                "cap_applied": False, "cap_reason": None}
+
+    # The weighting runs in the database so scoring only ever fetches a few
+    # scalars per subdomain, never one hydrated ORM pair per response. The
+    # expressions depend only on class constants, so each is built once.
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _evidence_blocked_clause(cls):
+        """Evidence policy as SQL.
+
+        If the question requires evidence and the response is at or above the
+        evidence threshold, the score is soft-capped unless the evidence status
+        is ACCEPTED. PENDING_VERIFICATION (uploaded but not yet verified) and
+        REJECTED both fall back to the cap so claims do not lift maturity
+        without a verified audit trail.
+        """
+        return and_(
+            QuestionV2.evidence_required == True,
+            ResponseV2.numeric_score >= cls.EVIDENCE_REQUIRED_FOR_SCORE_AT_OR_ABOVE,
+            or_(ResponseV2.evidence_status.is_(None),
+                ResponseV2.evidence_status != EvidenceStatus.ACCEPTED),
+        )
 
-            role_key = resp.respondent_role.value if resp.respondent_role else ""
-            role_w = self.ROLE_WEIGHTS.get(role_key, 0.20)  # unroled/unknown → neutral 0.20
-            q_w = question.weight or 1.0
-            combined = role_w * q_w
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _subdomain_aggregates(cls) -> Tuple:
+        """(response count, Σ score·weight, Σ weight, evidence-blocked count)."""
+        blocked = cls._evidence_blocked_clause()
+        score = ResponseV2.numeric_score
+        cap = cls.EVIDENCE_CAP_WITHOUT_ACCEPTED
+        effective = case((and_(blocked, score > cap), cap), else_=score)
+        role_w = case(cls.ROLE_WEIGHTS, value=ResponseV2.respondent_role,
+                      else_=cls.DEFAULT_ROLE_WEIGHT)
+        q_w = func.coalesce(func.nullif(QuestionV2.weight, 0), 1.0)
+        grade_mult = case(cls.EVIDENCE_GRADE_MULTIPLIERS,
+                          value=ResponseV2.evidence_grade, else_=1.0)
+        # role_w * q_w is evaluated first, as the same product the weight total
+        # sums, so both sums round exactly as the per-row arithmetic did.
+        # Unscored rows count as responses but add nothing to either sum.
+        combined = role_w * q_w
+        return (
+            func.count(ResponseV2.id),
+            func.sum(combined * effective * grade_mult),
+            func.sum(case((score.isnot(None), combined))),
+            func.sum(case((blocked, 1), else_=0)),
+        )
 
-            # Evidence grade multiplier
-            grade_mult = {"A": 1.0, "B": 0.95, "C": 0.85, "D": 0.75}.get(
-                resp.evidence_grade, 1.0
+    def _evidence_blocked_questions(self, assessment_id: int, blocked,
+                                    *criteria) -> List[Tuple[int, Dict]]:
+        """(subdomain id, detail) for each evidence-capped response."""
+        cap = self.EVIDENCE_CAP_WITHOUT_ACCEPTED
+        rows = (
+            self.db.query(QuestionV2.subdomain_id, QuestionV2.id, QuestionV2.question_code,
+                          ResponseV2.numeric_score, ResponseV2.evidence_status)
+            .join(QuestionV2, ResponseV2.question_id == QuestionV2.id)
+            .filter(
+                ResponseV2.assessment_id == assessment_id,
+                ResponseV2.is_draft == False,
+                ResponseV2.is_na == False,
+                blocked,
+                *criteria,
             )
-
-            total_weighted += effective_score * combined * grade_mult
-            total_weight += combined
-
-        raw = total_weighted / total_weight if total_weight > 0 else None
-
-        return {
-            "raw_score": round(raw, 2) if raw is not None else None,
-            "final_score": round(raw, 2) if raw is not None else None,  # caps applied later
-            "response_count": len(responses),
-            "evidence_blocked": evidence_blocked,
-            "evidence_blocked_questions": evidence_blocked_questions,
-            "cap_applied": False,
-            "cap_reason": None,
-        }
+            .order_by(ResponseV2.id)
+            .all()
+        )
+        return [(sd_id, {
+            "question_id": qid,
+            "code": code,
+            "claimed": float(score),
+            "capped_to": min(float(score), cap),
+            "evidence_status": status.value if status else None,
+        }) for sd_id, qid, code, score, status in rows]
 
     # ═══════════════════════════════════════════
     #  CAPS
@@ -295,45 +351,63 @@ class ScoringEngineV2:
     def _apply_critical_caps(self, assessment_id: int,
                              sd_results: Dict[str, Dict]) -> List[Dict]:
         """Apply weakest-link caps from critical failure items."""
-        caps = []
-        for q_code, rule in self.CRITICAL_CAPS.items():
-            question = self.db.query(QuestionV2).filter(
-                QuestionV2.question_code == q_code,
+        # The check only needs each critical item's id and this assessment's
+        # score for it: two projected queries instead of two full-row queries
+        # per rule.
+        question_ids = dict(self.db.execute(
+            select(QuestionV2.question_code, QuestionV2.id).where(
+                QuestionV2.question_code.in_(self.CRITICAL_CAPS),
                 QuestionV2.is_active == True,
-            ).first()
-            if not question:
-                continue
-
-            resp = self.db.query(ResponseV2).filter(
+            )
+        ).all())
+        if not question_ids:
+            return []
+
+        first_scores: Dict[int, Optional[float]] = {}
+        for question_id, numeric_score in self.db.execute(
+            select(ResponseV2.question_id, ResponseV2.numeric_score)
+            .where(
                 ResponseV2.assessment_id == assessment_id,
-                ResponseV2.question_id == question.id,
+                ResponseV2.question_id.in_(question_ids.values()),
                 ResponseV2.is_na == False,
-            ).first()
-            if not resp or resp.numeric_score is None:
+            )
+            .order_by(ResponseV2.id)
+        ):
+            first_scores.setdefault(question_id, numeric_score)
+
+        caps = []
+        tightest: Dict[str, Dict] = {}  # domain → lowest triggered cap rule
+        for q_code, rule in self.CRITICAL_CAPS.items():
+            score = first_scores.get(question_ids.get(q_code))
+            if score is None:
                 continue
 
             trigger = False
             if q_code in ("LC.2-01", "AI.1-01", "SG.1-01", "WC.1-01"):
-                trigger = resp.numeric_score == 1
+                trigger = score == 1
             elif q_code == "WM.3-03":
-                trigger = resp.numeric_score <= 2
+                trigger = score <= 2
 
             if trigger:
-                # Cap all subdomains in that domain
-                domain_code = rule["domain"]
-                for sd_code, sd_data in sd_results.items():
-                    if sd_code.startswith(domain_code + ".") and sd_data["final_score"] is not None:
-                        if sd_data["final_score"] > rule["cap"]:
-                            sd_data["final_score"] = rule["cap"]
-                            sd_data["cap_applied"] = True
-                            sd_data["cap_reason"] = rule["label"]
+                held = tightest.get(rule["domain"])
+                if held is None or rule["cap"] < held["cap"]:
+                    tightest[rule["domain"]] = rule
                 caps.append({
                     "question": q_code,
                     "domain": rule["domain"],
                     "cap": rule["cap"],
                     "label": rule["label"],
-                    "trigger_score": resp.numeric_score,
+                    "trigger_score": score,
                 })
+
+        # Cap all subdomains in each triggered domain, in a single sweep.
+        if tightest:
+            for sd_code, sd_data in sd_results.items():
+                rule = tightest.get(sd_code.partition(".")[0])
+                if rule and sd_data["final_score"] is not None and sd_data["final_score"] > rule["cap"]:
+                    sd_data["final_score"] = rule["cap"]
+                    sd_data["cap_applied"] = True
+                    sd_data["cap_reason"] = rule["label"]
         return caps
 
     # ═══════════════════════════════════════════
@@ -364,14 +438,14 @@ class ScoringEngineV2:
     def _apply_cmms_evidence_caps(self, assessment_id: int,
                                   sd_results: Dict[str, Dict]) -> List[Dict]:
         """Cap subdomains that require a CMMS snapshot but didn't get one."""
-        uploads = (
-            self.db.query(CMMSUploadV2)
-            .filter(
+        # Only kind and metrics are read; the file path, error text and
+        # bad-actor list never need to leave the database.
+        uploads = self.db.execute(
+            select(CMMSUploadV2.kind, CMMSUploadV2.metrics).where(
                 CMMSUploadV2.assessment_id == assessment_id,
                 CMMSUploadV2.status == "processed",
             )
-            .all()
-        )
+        ).all()
         kinds_present = {u.kind for u in uploads}
 
         caps = []
@@ -465,41 +539,48 @@ class ScoringEngineV2:
     #  CULTURAL BLIND SPOT DETECTION
     # ═══════════════════════════════════════════
 
-    def _detect_blind_spot(self, assessment_id: int, sd: Subdomain) -> Optional[Dict]:
-        """Detect variance between roles for a subdomain."""
-        responses = (
-            self.db.query(ResponseV2)
-            .join(QuestionV2)
+    def _detect_blind_spots(self, assessment_id: int, subdomains: List[Subdomain]) -> List[Dict]:
+        """Blind spots for ``subdomains``, in the order given.
+
+        Per-role averages come from one GROUP BY (subdomain, role) query, so
+        only a handful of scalars per subdomain leave the database.
+        """
+        rows = (
+            self.db.query(QuestionV2.subdomain_id, ResponseV2.respondent_role,
+                          func.avg(ResponseV2.numeric_score))
+            .join(QuestionV2, ResponseV2.question_id == QuestionV2.id)
             .filter(
                 ResponseV2.assessment_id == assessment_id,
-                QuestionV2.subdomain_id == sd.id,
+                QuestionV2.subdomain_id.in_([sd.id for sd in subdomains]),
                 ResponseV2.numeric_score.isnot(None),
                 ResponseV2.is_draft == False,
                 ResponseV2.is_na == False,
             )
+            .group_by(QuestionV2.subdomain_id, ResponseV2.respondent_role)
+            .order_by(QuestionV2.subdomain_id, ResponseV2.respondent_role)
             .all()
         )
 
-        role_scores: Dict[str, List[float]] = {}
-        for r in responses:
-            role = r.respondent_role.value if r.respondent_role else "UNKNOWN"
-            role_scores.setdefault(role, []).append(r.numeric_score)
-
-        if len(role_scores) < 2:
-            return None
+        role_avgs_by_sd: Dict[int, Dict[str, float]] = {}
+        for sd_id, role, avg in rows:
+            role_avgs_by_sd.setdefault(sd_id, {})[role.value if role else "UNKNOWN"] = avg
 
-        role_avgs = {r: mean(scores) for r, scores in role_scores.items()}
-        variance = max(role_avgs.values()) - min(role_avgs.values())
+        blind_spots = []
+        for sd in subdomains:
+            role_avgs = role_avgs_by_sd.get(sd.id, {})
+            if len(role_avgs) < 2:
+                continue
 
-        if variance >= self.CULTURAL_DISCONNECT_THRESHOLD:
-            severity = "critical" if variance >= self.CRITICAL_DISCONNECT_THRESHOLD else "warning"
-            return {
-                "subdomain": sd.code,
-                "variance": round(variance, 2),
-                "role_averages": {k: round(v, 2) for k, v in role_avgs.items()},
-                "severity": severity,
-            }
-        return None
+            variance = max(role_avgs.values()) - min(role_avgs.values())
+            if variance >= self.CULTURAL_DISCONNECT_THRESHOLD:
+                severity = "critical" if variance >= self.CRITICAL_DISCONNECT_THRESHOLD else "warning"
+                blind_spots.append({
+                    "subdomain": sd.code,
+                    "variance": round(variance, 2),
+                    "role_averages": {k: round(v, 2) for k, v in role_avgs.items()},
+                    "severity": severity,
+                })
+        return blind_spots
 
     # ═══════════════════════════════════════════
     #  CONFIDENCE
@@ -515,19 +596,17 @@ class ScoringEngineV2:
         if mode == AssessmentMode.QUICKSCAN:
             confidence -= 0.25
 
-        # Evidence gaps
-        total_responses = self.db.query(ResponseV2).filter(
-            ResponseV2.assessment_id == assessment_id,
-            ResponseV2.is_na == False,
-        ).count()
+        # Evidence gaps — both counts from one pass over the assessment's rows.
         # Evidence still missing (awaiting) OR rejected by the AI relevance gate
         # (e.g. an unrelated file) both leave the claim unsupported.
-        evidence_blocked = self.db.query(ResponseV2).filter(
-            ResponseV2.assessment_id == assessment_id,
-            ResponseV2.evidence_status.in_([
-                EvidenceStatus.PENDING_EVIDENCE, EvidenceStatus.REJECTED,
-            ]),
-        ).count()
+        total_responses, evidence_blocked = self.db.execute(
+            select(
+                func.count(case((ResponseV2.is_na == False, 1))),
+                func.count(case((ResponseV2.evidence_status.in_([
+                    EvidenceStatus.PENDING_EVIDENCE, EvidenceStatus.REJECTED,
+                ]), 1))),
+            ).where(ResponseV2.assessment_id == assessment_id)
+        ).one()
         if total_responses > 0:
             confidence -= (evidence_blocked / total_responses) * 0.30
 
@@ -547,11 +626,10 @@ class ScoringEngineV2:
     def _get_maturity_level(self, score: float) -> str:
         if score is None:
             return "Level 1 - Reactive"
-        clamped = max(1.0, min(5.0, score))
-        for low, high, level_num, name in self.MATURITY_LEVELS:
-            if low <= clamped < high:
-                return f"Level {level_num} - {name}"
-        return "Level 5 - Prescriptive"
+        # bisect_right keeps the bands half-open: a score on an edge moves up.
+        # Clamping is implicit -- below the first edge is Level 1, past the
+        # last is Level 5.
+        return self._MATURITY_LABELS[bisect_right(self._MATURITY_EDGES, score)]
 
     # ═══════════════════════════════════════════
     #  VELOCITY
@@ -559,17 +637,17 @@ class ScoringEngineV2:
 
     def _calculate_velocity(self, assessment: AssessmentV2) -> Dict:
         """Compare to most recent previous assessment for the same site."""
-        previous = (
-            self.db.query(AssessmentV2)
-            .filter(
+        previous = self.db.execute(
+            select(AssessmentV2.overall_rmi, AssessmentV2.assessment_date)
+            .where(
                 AssessmentV2.site_name == assessment.site_name,
                 AssessmentV2.id != assessment.id,
                 AssessmentV2.overall_rmi.isnot(None),
                 AssessmentV2.assessment_date < assessment.assessment_date,
             )
             .order_by(AssessmentV2.assessment_date.desc())
-            .first()
-        )
+            .limit(1)
+        ).first()
         if not previous or not previous.overall_rmi or not assessment.overall_rmi:
             return {"status": "baseline", "message": "No previous assessment for velocity"}
 
@@ -627,21 +705,23 @@ class ScoringEngineV2:
             SubdomainScore.assessment_id == assessment.id
         ).delete()
 
-        # Insert new
-        subdomains = self.db.query(Subdomain).all()
-        sd_map = {sd.code: sd.id for sd in subdomains}
-
-        for code, data in sd_results.items():
-            if code in sd_map:
-                self.db.add(SubdomainScore(
-                    assessment_id=assessment.id,
-                    subdomain_id=sd_map[code],
-                    raw_score=data.get("raw_score"),
-                    final_score=data.get("final_score"),
-                    cap_applied=data.get("cap_applied", False),
-                    cap_reason=data.get("cap_reason"),
-                    confidence=confidence,
-                ))
+        # Insert new — one executemany, no per-row ORM unit-of-work
+        sd_map = dict(self.db.execute(select(Subdomain.code, Subdomain.id)).all())
+        rows = [
+            {
+                "assessment_id": assessment.id,
+                "subdomain_id": sd_map[code],
+                "raw_score": data.get("raw_score"),
+                "final_score": data.get("final_score"),
+                "cap_applied": data.get("cap_applied", False),
+                "cap_reason": data.get("cap_reason"),
+                "confidence": confidence,
+            }
+            for code, data in sd_results.items()
+            if code in sd_map
+        ]
+        if rows:
+            self.db.execute(insert(SubdomainScore), rows)
 
         # Update assessment record
         assessment.overall_rmi = overall_rmi
@@ -6,6 +6,8 @@ import os, sys
 os.environ.setdefault("LOCAL_DEV_MODE", "true")
 sys.path.insert(0, os.path.dirname(__file__))
 
+from sqlalchemy import insert, select
+
 from database import SessionLocal
 from models_v2 import Practice, Subdomain
 
@@ -356,13 +358,14 @@ PRACTICES = {
 
 def seed_practices(db):
     """Seed the practice library into the database."""
-    from models_v2 import Subdomain
-    import json
+    # Two lookups up front instead of one per subdomain and one per practice.
+    subdomain_ids = dict(db.execute(select(Subdomain.code, Subdomain.id)).all())
+    seeded = set(db.scalars(select(Practice.practice_id)))
 
-    count = 0
+    rows = []
     for sd_code, practices in PRACTICES.items():
-        subdomain = db.query(Subdomain).filter(Subdomain.code == sd_code).first()
-        if not subdomain:
+        subdomain_id = subdomain_ids.get(sd_code)
+        if subdomain_id is None:
             print(f"  ⚠️  Subdomain {sd_code} not found, skipping")
             continue
 
@@ -370,14 +373,15 @@ def seed_practices(db):
             practice_code = f"{sd_code}-{from_lvl}{to_lvl}-P"
             practice_id = f"{sd_code}-{from_lvl}to{to_lvl}"
 
-            existing = db.query(Practice).filter(Practice.practice_id == practice_id).first()
-            if existing:
+            if practice_id in seeded:
                 continue
 
-            p = Practice(
+            # The list/dict fields are JSON columns: pass them as-is so they
+            # are encoded once (practice_engine still parses older string rows).
+            rows.append(dict(
                 practice_id=practice_id,
                 practice_code=practice_code,
-                subdomain_id=subdomain.id,
+                subdomain_id=subdomain_id,
                 title=title,
                 description=description,
                 from_level=from_lvl,
@@ -387,22 +391,23 @@ def seed_practices(db):
                 effort_rating=effort,
                 timeline=timeline,
                 is_critical_path=is_crit,
-                success_metrics=json.dumps(metrics),
-                resources=json.dumps([]),
-                tools=json.dumps(tools),
-                pathways=json.dumps({
+                success_metrics=metrics,
+                resources=[],
+                tools=tools,
+                pathways={
                     f"{from_lvl}_to_{to_lvl}": {
                         "focus": title,
                         "timeline": timeline,
                     }
-                }),
+                },
                 is_active=True,
-            )
-            db.add(p)
-            count += 1
+            ))
 
+    # One executemany.
+    if rows:
+        db.execute(insert(Practice), rows)
     db.commit()
-    return count
+    return len(rows)
 
 
 if __name__ == "__main__":
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from dataclasses import dataclass
 from typing import Iterator, Optional
 
@@ -104,6 +105,26 @@ def _supa_client() -> tuple[str, dict[str, str]]:
     return base, headers
 
 
+_HTTP: Optional[httpx.Client] = None
+_HTTP_LOCK = threading.Lock()
+
+
+def _http() -> httpx.Client:
+    """Process-wide keep-alive client for Storage calls.
+
+    Module-level ``httpx.post`` opens (and TLS-handshakes) a fresh connection
+    per call; a shared client pools them, so a page of evidence uploads or
+    signed-URL redirects reuses one connection. ``httpx.Client`` is safe to
+    share across the threadpool FastAPI runs sync routes on.
+    """
+    global _HTTP
+    if _HTTP is None:
+        with _HTTP_LOCK:
+            if _HTTP is None:
+                _HTTP = httpx.Client()
+    return _HTTP
+
+
 def _supa_put(subdir: str, filename: str, data: bytes, mime: Optional[str]) -> StoredObject:
     base, headers = _supa_client()
     key = f"{subdir.strip('/')}/{filename}"
@@ -111,7 +132,7 @@ def _supa_put(subdir: str, filename: str, data: bytes, mime: Optional[str]) -> S
     h = {**headers, "x-upsert": "true"}
     if mime:
         h["Content-Type"] = mime
-    r = httpx.post(url, content=data, headers=h, timeout=60.0)
+    r = _http().post(url, content=data, headers=h, timeout=60.0)
     r.raise_for_status()
     return StoredObject(backend="supabase", key=key, bytes=len(data), mime=mime)
 
@@ -119,7 +140,7 @@ def _supa_put(subdir: str, filename: str, data: bytes, mime: Optional[str]) -> S
 def _supa_signed_url(key: str, ttl_seconds: int) -> str:
     base, headers = _supa_client()
     url = f"{base}/storage/v1/object/sign/{SUPABASE_BUCKET}/{key}"
-    r = httpx.post(url, json={"expiresIn": ttl_seconds}, headers=headers, timeout=15.0)
+    r = _http().post(url, json={"expiresIn": ttl_seconds}, headers=headers, timeout=15.0)
     r.raise_for_status()
     signed = r.json().get("signedURL") or r.json().get("signedUrl") or ""
     # Supabase returns a relative URL; resolve against base
@@ -131,7 +152,7 @@ def _supa_signed_url(key: str, ttl_seconds: int) -> str:
 def _supa_stream(key: str) -> Iterator[bytes]:
     base, headers = _supa_client()
     url = f"{base}/storage/v1/object/{SUPABASE_BUCKET}/{key}"
-    with httpx.stream("GET", url, headers=headers, timeout=60.0) as r:
+    with _http().stream("GET", url, headers=headers, timeout=60.0) as r:
         r.raise_for_status()
         for chunk in r.iter_bytes(chunk_size=1024 * 1024):
             yield chunk
@@ -140,7 +161,7 @@ def _supa_stream(key: str) -> Iterator[bytes]:
 def _supa_delete(key: str) -> None:
     base, headers = _supa_client()
     url = f"{base}/storage/v1/object/{SUPABASE_BUCKET}/{key}"
-    httpx.delete(url, headers=headers, timeout=15.0).raise_for_status()
+    _http().delete(url, headers=headers, timeout=15.0).raise_for_status()
 
 
 # ---------------------------------------------------------------------------
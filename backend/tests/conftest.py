@@ -31,6 +31,15 @@ import database  # noqa: E402  -- must come after env setup
 from database import Base, get_db  # noqa: E402
 
 
+@pytest.fixture(autouse=True)
+def _fresh_login_window():
+    """Reset the in-process login limiter: every test's first user is
+    user1@example.com, so its 60 s window would otherwise carry across tests."""
+    from security_utils import login_limiter
+
+    login_limiter._hits.clear()
+
+
 @pytest.fixture(scope="function")
 def tmp_upload_dir(tmp_path, monkeypatch):
     upload_dir = tmp_path / "uploads"
@@ -47,7 +56,8 @@ def db_session(tmp_path, monkeypatch):
     """A fresh in-process SQLite database for each test."""
     db_path = tmp_path / "test.db"
     url = f"sqlite:///{db_path}"
-    test_engine = create_engine(url, connect_args={"check_same_thread": False})
+    test_engine = create_engine(url, connect_args=database.SQLITE_CONNECT_ARGS)
+    database.configure_sqlite(test_engine)
     TestingSession = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
     monkeypatch.setattr(database, "engine", test_engine)
@@ -99,7 +109,8 @@ def make_user(db_session):
             full_name=f"User {counter['n']}",
             role=role,
             is_active=active,
-            hashed_password=bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8"),
+            # Minimum cost: every login in a test pays one checkpw against this.
+            hashed_password=bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=4)).decode("utf-8"),
         )
         db_session.add(u)
         db_session.commit()
@@ -111,15 +122,22 @@ def make_user(db_session):
 
 @pytest.fixture
 def auth_headers(client, make_user):
-    """Return a function that gives `Authorization: Bearer ...` headers."""
+    """Return a function that gives `Authorization: Bearer ...` headers.
+
+    Tokens are cached per email for the test, so asking for the same user's
+    headers twice logs in once.
+    """
+    tokens = {}
+
     def _headers(user_password_pair):
         user, password = user_password_pair
-        r = client.post(
-            "/token",
-            data={"username": user.email, "password": password},
-        )
-        assert r.status_code == 200, r.text
-        token = r.json()["access_token"]
-        return {"Authorization": f"Bearer {token}"}
+        if user.email not in tokens:
+            r = client.post(
+                "/token",
+                data={"username": user.email, "password": password},
+            )
+            assert r.status_code == 200, r.text
+            tokens[user.email] = r.json()["access_token"]
+        return {"Authorization": f"Bearer {tokens[user.email]}"}
 
     return _headers
@@ -94,3 +94,60 @@ class TestPasswordReset:
             json={"token": token, "new_password": "short"},
         )
         assert r2.status_code == 400
+
+
+class TestSupabaseTokenCache:
+    """Verified Supabase tokens are reused until the cache TTL or token exp."""
+
+    def _setup(self, monkeypatch):
+        import time
+
+        import jwt
+        from cryptography.hazmat.primitives.asymmetric import ec
+
+        import auth
+        from config import settings
+
+        key = ec.generate_private_key(ec.SECP256R1())
+        lookups = []
+
+        class FakeJWKS:
+            def get_signing_key_from_jwt(self, token):
+                lookups.append(token)
+                return jwt.PyJWK.from_dict(
+                    {**jwt.algorithms.ECAlgorithm.to_jwk(key.public_key(), as_dict=True),
+                     "alg": "ES256"})
+
+        monkeypatch.setattr(settings, "SUPABASE_URL", "https://proj.supabase.co")
+        monkeypatch.setattr(auth, "_jwks", lambda: FakeJWKS())
+        monkeypatch.setattr(auth, "_token_cache", type(auth._token_cache)())
+
+        def issue(email, ttl=3600):
+            return jwt.encode(
+                {"sub": "u1", "email": email, "aud": "authenticated",
+                 "iss": "https://proj.supabase.co/auth/v1", "exp": int(time.time()) + ttl},
+                key, algorithm="ES256")
+
+        return auth, issue, lookups
+
+    def test_repeat_token_skips_verification(self, monkeypatch):
+        auth, issue, lookups = self._setup(monkeypatch)
+        token = issue("a@next-belt.com")
+        assert auth._email_from_supabase_token(token) == "a@next-belt.com"
+        assert auth._email_from_supabase_token(token) == "a@next-belt.com"
+        assert len(lookups) == 1
+        assert token.encode() not in b"".join(auth._token_cache)
+
+    def test_entry_never_outlives_token(self, monkeypatch):
+        import jwt
+
+        auth, issue, _ = self._setup(monkeypatch)
+        token = issue("a@next-belt.com", ttl=1)
+        auth._email_from_supabase_token(token)
+        (_, expires), = auth._token_cache.values()
+        assert expires <= jwt.decode(token, options={"verify_signature": False})["exp"]
+
+    def test_invalid_token_not_cached(self, monkeypatch):
+        auth, _, _ = self._setup(monkeypatch)
+        assert auth._email_from_supabase_token("not-a-jwt") is None
+        assert not auth._token_cache
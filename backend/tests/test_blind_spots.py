@@ -0,0 +1,52 @@
+"""Cultural blind spots: role-average variance per subdomain."""
+from datetime import date
+
+
+def test_blind_spots_grouped_per_subdomain_and_role(db_session, make_user):
+    from models_v2 import (
+        AssessmentMode, AssessmentV2, Domain, DomainType, QuestionV2, Subdomain,
+        TargetRoleV2, ResponseV2,
+    )
+    from scoring_engine_v2 import ScoringEngineV2
+
+    user, _ = make_user()
+    a = AssessmentV2(client_name="X", site_name="Y", assessment_mode=AssessmentMode.STANDARD,
+                     assessment_date=date.today(), status="in_progress", creator_id=user.id)
+    db_session.add(a); db_session.flush()
+    dom = Domain(code="WM", name="Work Management", description="", display_order=1)
+    db_session.add(dom); db_session.flush()
+    sds, qs = [], []
+    for n in (1, 2):
+        sd = Subdomain(domain_id=dom.id, code=f"WM.{n}", name="s", display_order=n)
+        db_session.add(sd); db_session.flush()
+        sds.append(sd)
+        for k in (1, 2):
+            q = QuestionV2(subdomain_id=sd.id, question_code=f"WM.{n}-0{k}", question_text="?",
+                           question_type="likert", domain=DomainType.WM,
+                           target_role=TargetRoleV2.TECHNICIAN, weight=1.0,
+                           scoring_rubric={"1": "a"}, is_critical=False,
+                           evidence_required=False, is_active=True)
+            db_session.add(q); db_session.flush()
+            qs.append(q.id)
+
+    sd1, sd2 = sds
+    q1a, q1b, q2a, _ = qs
+    for qid, role, score in [
+        # WM.1: technicians average 1.5, managers 4.0 -> 2.5 gap (critical)
+        (q1a, TargetRoleV2.TECHNICIAN, 1.0), (q1b, TargetRoleV2.TECHNICIAN, 2.0),
+        (q1a, TargetRoleV2.MANAGER, 4.0), (q1b, None, None),
+        # WM.2: roles broadly agree -> no blind spot
+        (q2a, TargetRoleV2.TECHNICIAN, 3.0), (q2a, TargetRoleV2.MANAGER, 3.5),
+    ]:
+        db_session.add(ResponseV2(assessment_id=a.id, question_id=qid, numeric_score=score,
+                                  respondent_role=role, is_draft=False, is_na=False))
+    db_session.commit()
+
+    engine = ScoringEngineV2(db_session)
+    # WM.2 is absent: its role averages are within the threshold.
+    assert engine._detect_blind_spots(a.id, [sd1, sd2]) == [{
+        "subdomain": "WM.1",
+        "variance": 2.5,
+        "role_averages": {"MANAGER": 4.0, "TECHNICIAN": 1.5},
+        "severity": "critical",
+    }]
@@ -0,0 +1,34 @@
+"""CMMS evidence caps: missing snapshots cap claims, present ones soft-floor them."""
+from datetime import date
+
+
+def test_snapshot_presence_and_metrics_cap_subdomains(db_session, make_user):
+    from models_v2 import AssessmentMode, AssessmentV2, CMMSUploadV2
+    from scoring_engine_v2 import ScoringEngineV2
+
+    user, _ = make_user()
+    a = AssessmentV2(client_name="X", site_name="Y", assessment_mode=AssessmentMode.STANDARD,
+                     assessment_date=date.today(), status="in_progress", creator_id=user.id)
+    db_session.add(a); db_session.flush()
+    db_session.add_all([
+        CMMSUploadV2(assessment_id=a.id, kind="work_orders", file_path="wo.csv",
+                     status="processed",
+                     metrics={"data_quality": {"score": 2.0},
+                              "reactive_ratio": {"reactive_ratio": 0.7}}),
+        CMMSUploadV2(assessment_id=a.id, kind="pm", file_path="pm.csv", status="error"),
+    ])
+    db_session.commit()
+
+    sd_results = {code: {"final_score": 4.5, "cap_applied": False, "cap_reason": None}
+                  for code in ("AI.1", "AI.2", "WM.1", "WM.2")}
+    caps = ScoringEngineV2(db_session)._apply_cmms_evidence_caps(a.id, sd_results)
+
+    assert {c["source"]: c.get("subdomain") for c in caps} == {
+        "cmms_evidence_missing": "WM.2",  # the PM upload failed, so no snapshot
+        "cmms_data_quality": "AI.2",
+        "cmms_reactive_ratio": "WM.1",
+    }
+    assert sd_results["AI.1"]["final_score"] == 4.5
+    assert sd_results["AI.2"]["final_score"] == 2.5
+    assert sd_results["WM.1"]["final_score"] == 3.0
+    assert sd_results["WM.2"]["final_score"] == 3.0
@@ -39,6 +39,18 @@ def test_reactive_ratio_high_trips_wm1_threshold():
     assert m["reactive_ratio"] > 0.5
 
 
+def test_reactive_ratio_ignores_case_and_missing_types():
+    df = pd.DataFrame({"work_order_type": ["Emergency", "URGENT", None, "PM", "pm", "Breakdown"]})
+    m = calculate_reactive_ratio(df)
+    assert m["reactive_work_orders"] == 3
+    assert m["total_work_orders"] == 6
+
+
+def test_reactive_ratio_falls_back_to_priority():
+    df = pd.DataFrame({"priority": [1, 2, 1, 3, 4]})
+    assert calculate_reactive_ratio(df)["reactive_work_orders"] == 2
+
+
 def test_pm_compliance_fraction_and_stable_alias():
     df = pd.DataFrame(
         {
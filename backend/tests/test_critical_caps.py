@@ -0,0 +1,56 @@
+"""Weakest-link regression: a critical-failure answer caps every subdomain in
+its domain, and only the rule's trigger scores fire it.
+"""
+from datetime import date
+
+import pytest
+
+
+def _seed(db_session, creator_id, *, score):
+    from models_v2 import (
+        AssessmentMode, AssessmentV2, Domain, DomainType, QuestionV2, ResponseV2,
+        Subdomain, TargetRoleV2,
+    )
+
+    a = AssessmentV2(client_name="ACME", site_name="Plant A",
+                     assessment_mode=AssessmentMode.STANDARD,
+                     assessment_date=date.today(), status="in_progress",
+                     creator_id=creator_id)
+    dom = Domain(code="WM", name="Work Management", description="", display_order=1)
+    db_session.add_all([a, dom])
+    db_session.flush()
+    sd = Subdomain(domain_id=dom.id, code="WM.3", name="Work Execution", display_order=1)
+    db_session.add(sd)
+    db_session.flush()
+    q = QuestionV2(subdomain_id=sd.id, question_code="WM.3-03", question_text="LOTO?",
+                   question_type="likert", domain=DomainType.WM,
+                   target_role=TargetRoleV2.SUPERVISOR, weight=1.0,
+                   scoring_rubric={"1": "a", "5": "b"}, is_critical=True,
+                   evidence_required=False, is_active=True)
+    db_session.add(q)
+    db_session.flush()
+    db_session.add(ResponseV2(assessment_id=a.id, question_id=q.id, numeric_score=score,
+                              respondent_role=TargetRoleV2.SUPERVISOR,
+                              is_draft=False, is_na=False))
+    db_session.commit()
+    return a
+
+
+@pytest.mark.parametrize("score,capped", [(2.0, True), (3.0, False)])
+def test_loto_failure_caps_work_management(db_session, make_user, score, capped):
+    from scoring_engine_v2 import ScoringEngineV2
+
+    user, _ = make_user()
+    a = _seed(db_session, user.id, score=score)
+    sd_results = {"WM.3": {"final_score": 4.5, "cap_applied": False, "cap_reason": None}}
+
+    caps = ScoringEngineV2(db_session)._apply_critical_caps(a.id, sd_results)
+
+    if capped:
+        assert [c["question"] for c in caps] == ["WM.3-03"]
+        assert caps[0]["trigger_score"] == score
+        assert sd_results["WM.3"]["final_score"] == 3.0
+        assert sd_results["WM.3"]["cap_applied"] is True
+    else:
+        assert caps == []
+        assert sd_results["WM.3"]["final_score"] == 4.5
@@ -0,0 +1,25 @@
+"""SQLite connection profile applied by database.py."""
+from sqlalchemy import text
+
+
+def test_sqlite_connections_use_wal_profile(db_session):
+    pragma = lambda name: db_session.execute(text(f"PRAGMA {name}")).scalar()  # noqa: E731
+    assert pragma("journal_mode") == "wal"
+    assert pragma("synchronous") == 1  # NORMAL
+    assert pragma("busy_timeout") == 5000
+
+
+def test_closing_pooled_connections_refreshes_planner_stats(db_session):
+    import database
+
+    db_session.execute(text("CREATE TABLE t (a INTEGER, b INTEGER)"))
+    db_session.execute(text("CREATE INDEX ix_t_a ON t (a)"))
+    db_session.execute(text("INSERT INTO t VALUES (:a, :a)"), [{"a": i} for i in range(2000)])
+    db_session.commit()
+    db_session.execute(text("SELECT b FROM t WHERE a = 5")).all()
+    db_session.close()
+
+    database.engine.dispose()  # closes the pooled connection -> PRAGMA optimize
+    with database.engine.connect() as conn:
+        stats = conn.execute(text("SELECT tbl FROM sqlite_stat1")).scalars().all()
+    assert "t" in stats
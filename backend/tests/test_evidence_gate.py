@@ -21,6 +21,16 @@ def test_normalize_payload_verdict():
     assert norm({"verdict": "irrelevant", "observations": "a selfie"}, "image")["reason"] == "a selfie"
 
 
+def test_format_rubric_keeps_every_entry():
+    from ai_scoring import AIScoringEngine
+    fmt = AIScoringEngine._format_rubric  # staticmethod; no API key needed
+
+    assert fmt({"3": "c", "1": "a"}) == "\n**Scoring rubric:**\n1: a\n3: c"
+    # Keys rubric_levels() would drop still reach the prompt.
+    assert fmt({"2": "b", "1.5": "ab"}) == "\n**Scoring rubric:**\n1.5: ab\n2: b"
+    assert fmt({"1": "a", "notes": "n"}) == "\n**Scoring rubric:**\n1: a\nnotes: n"
+
+
 def _setup(db_session, creator_id, evidence_status):
     from models_v2 import (
         AssessmentMode, AssessmentV2, Domain, DomainType, QuestionV2, Subdomain,
@@ -0,0 +1,58 @@
+"""Tests for the read-only question catalog and the seeder built on it."""
+import pytest
+from sqlalchemy import event
+
+from models_v2 import QuestionV2, Subdomain
+from question_bank_v2 import preload_question_bank, seed_question_bank_v2
+from question_catalog import catalog_domains, question_catalog, rubric_levels
+
+
+def test_catalog_shape_and_immutability():
+    catalog = question_catalog()
+    assert len(catalog) == 150
+    assert [d.code for d in catalog_domains()] == ["WC", "LC", "WM", "AI", "SG"]
+    assert sum(len(d.subdomains) for d in catalog_domains()) == 15
+    assert catalog["WC.1-01"]["subdomain_code"] == "WC.1"
+    # Parsed once per process, and neither level can be written to.
+    assert question_catalog() is catalog
+    with pytest.raises(TypeError):
+        catalog["XX.1-01"] = {}
+    with pytest.raises(TypeError):
+        catalog["WC.1-01"]["question_text"] = "changed"
+
+
+def test_seed_inserts_catalog_once(db_session):
+    assert seed_question_bank_v2(db_session) == 150
+    assert seed_question_bank_v2(db_session) == 0  # idempotent re-run
+    assert db_session.query(QuestionV2).count() == 150
+    assert db_session.query(Subdomain).count() == 15
+    # The rubric is stored as a JSON object, not a double-encoded string.
+    rubric = db_session.query(QuestionV2.scoring_rubric).filter(
+        QuestionV2.question_code == "WC.1-01").scalar()
+    assert rubric == dict(question_catalog()["WC.1-01"]["scoring_rubric"])
+
+
+def test_preload_returns_questions_by_id_in_one_query(db_session):
+    seed_question_bank_v2(db_session)
+    db_session.expunge_all()
+    ids = [qid for (qid,) in db_session.query(QuestionV2.id).limit(5)]
+
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        loaded = preload_question_bank(db_session, ids)
+        assert {qid: loaded[qid].id for qid in ids} == {qid: qid for qid in ids}
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert len(statements) == 1
+
+
+def test_rubric_levels():
+    levels = rubric_levels(question_catalog()["WC.1-01"]["scoring_rubric"])
+    assert [score for score, _ in levels] == [1, 2, 3, 4, 5]
+
+    legacy = rubric_levels('{"3": "c", "1": "a", "x": "ignored"}')
+    assert legacy == ((1, "a"), (3, "c"))
+    assert rubric_levels("not json") == ()
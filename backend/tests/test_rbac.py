@@ -57,6 +57,19 @@ class TestV2Visibility:
         assert isinstance(ids, list)
         assert len(ids) == 1
 
+    def test_created_assessment_reply_matches_stored_row(self, client, make_user, auth_headers):
+        alice = make_user(role="auditor")
+        r = client.post("/api/v2/assessments", headers=auth_headers(alice),
+                        json={"organization_name": "Acme", "site_name": "Plant 1"})
+        assert r.status_code == 200
+        created = r.json()
+        assert created["id"]
+
+        r = client.get(f"/api/v2/assessments/{created['id']}", headers=auth_headers(alice))
+        assert r.status_code == 200
+        stored = r.json()
+        assert {k: stored[k] for k in created} == created
+
     def test_admin_sees_all_v2_assessments(self, client, db_session, make_user, auth_headers):
         alice = make_user(role="auditor")
         bob = make_user(role="auditor")
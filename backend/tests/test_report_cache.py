@@ -0,0 +1,74 @@
+"""The report fingerprint changes whenever anything the PDF is built from does."""
+import os
+import re
+from datetime import date
+
+import pytest
+
+# Settings the renderers read that decide where/how a PDF is built, not what
+# it contains.
+_NON_CONTENT_SETTINGS = {"REPORT_OUTPUT_DIR", "REPORT_BUILD_PROCESSES"}
+
+
+def _assessment_with_response(db_session, user):
+    from models_v2 import (
+        AssessmentMode, AssessmentV2, Domain, DomainType, QuestionV2, ResponseV2,
+        Subdomain, TargetRoleV2,
+    )
+
+    dom = Domain(code="WC", name="Workforce Capability", description="", display_order=1)
+    db_session.add(dom); db_session.flush()
+    sd = Subdomain(domain_id=dom.id, code="WC.1", name="s", display_order=1)
+    db_session.add(sd); db_session.flush()
+    q = QuestionV2(subdomain_id=sd.id, question_code="WC.1-01", question_text="?",
+                   question_type="likert", domain=DomainType.WC,
+                   target_role=TargetRoleV2.TECHNICIAN, weight=1.0, scoring_rubric={},
+                   is_critical=False, evidence_required=False, is_active=True)
+    a = AssessmentV2(client_name="X", site_name="Y", assessment_mode=AssessmentMode.STANDARD,
+                     assessment_date=date.today(), status="in_progress", creator_id=user.id)
+    db_session.add_all([q, a]); db_session.flush()
+    r = ResponseV2(assessment_id=a.id, question_id=q.id, numeric_score=4.0,
+                   evidence_grade="A", is_draft=False, is_na=False)
+    db_session.add(r); db_session.commit()
+    return a, q, r
+
+
+def test_hash_follows_evidence_grade_and_question_weight(db_session, make_user):
+    from report_cache import report_content_hash
+
+    user, _ = make_user()
+    a, q, r = _assessment_with_response(db_session, user)
+    before = report_content_hash(db_session, a, "executive_v2")
+    assert report_content_hash(db_session, a, "executive_v2") == before
+
+    r.evidence_grade = "D"
+    db_session.commit()
+    regraded = report_content_hash(db_session, a, "executive_v2")
+    assert regraded != before
+
+    q.weight = 2.0
+    db_session.commit()
+    assert report_content_hash(db_session, a, "executive_v2") != regraded
+
+
+@pytest.mark.parametrize("name", ["FIRM_TAGLINE", "FIRM_WEBSITE", "FIRM_EMAIL", "LOGO_PATH"])
+def test_hash_follows_branding(db_session, make_user, monkeypatch, name):
+    from config import settings
+    from report_cache import report_content_hash
+
+    user, _ = make_user()
+    a, _, _ = _assessment_with_response(db_session, user)
+    before = report_content_hash(db_session, a, "executive_v2")
+    monkeypatch.setattr(settings, name, "changed")
+    assert report_content_hash(db_session, a, "executive_v2") != before
+
+
+def test_every_rendered_setting_is_fingerprinted():
+    from report_cache import REPORT_SETTINGS
+
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    read = set()
+    for module in ("report_generator_v2.py", "report_renderer.py"):
+        with open(os.path.join(backend, module), encoding="utf-8") as f:
+            read |= set(re.findall(r"settings\.([A-Z_][A-Z0-9_]*)", f.read()))
+    assert read - _NON_CONTENT_SETTINGS <= set(REPORT_SETTINGS)
@@ -4,8 +4,10 @@ not mutate the assessment's persisted scores (generation is read-only).
 import os
 from datetime import date
 
+import pytest
 
-def test_report_generates_nondestructive_pdf(db_session, make_user, tmp_upload_dir):
+
+def _scored_assessment(db_session, user):
     from models_v2 import (
         AssessmentMode,
         AssessmentV2,
@@ -13,9 +15,6 @@ def test_report_generates_nondestructive_pdf(db_session, make_user, tmp_upload_d
         Subdomain,
         SubdomainScore,
     )
-    from report_generator_v2 import ReportGeneratorV2
-
-    user, _ = make_user(role="admin")
 
     dom = Domain(code="WC", name="Workforce Capability", display_order=1)
     db_session.add(dom)
@@ -45,6 +44,14 @@ def test_report_generates_nondestructive_pdf(db_session, make_user, tmp_upload_d
         SubdomainScore(assessment_id=a.id, subdomain_id=sd.id, raw_score=3.2, final_score=3.2)
     )
     db_session.commit()
+    return a
+
+
+def test_report_generates_nondestructive_pdf(db_session, make_user, tmp_upload_dir):
+    from report_generator_v2 import ReportGeneratorV2
+
+    user, _ = make_user(role="admin")
+    a = _scored_assessment(db_session, user)
 
     gen = ReportGeneratorV2(db_session, output_dir=tmp_upload_dir["report"])
     path = gen.generate(assessment_id=a.id, generated_by=user.id)
@@ -60,3 +67,101 @@ def test_report_generates_nondestructive_pdf(db_session, make_user, tmp_upload_d
     from models import Report
 
     assert db_session.query(Report).filter(Report.assessment_id == a.id).count() == 1
+
+
+def test_unchanged_assessment_reuses_last_report(db_session, make_user, tmp_upload_dir):
+    from models import Report
+    from models_v2 import SubdomainScore
+    from report_generator_v2 import ReportGeneratorV2
+
+    user, _ = make_user(role="admin")
+    a = _scored_assessment(db_session, user)
+    gen = ReportGeneratorV2(db_session, output_dir=tmp_upload_dir["report"])
+
+    first = gen.generate(assessment_id=a.id, generated_by=user.id)
+    mtime = os.path.getmtime(first)
+    assert gen.generate(assessment_id=a.id, generated_by=user.id) == first
+    assert os.path.getmtime(first) == mtime  # not re-rendered
+    assert db_session.query(Report).filter(Report.assessment_id == a.id).count() == 1
+
+    # Any change to the report's inputs invalidates the cached PDF.
+    db_session.query(SubdomainScore).filter(SubdomainScore.assessment_id == a.id).update(
+        {"final_score": 2.1})
+    db_session.commit()
+    gen.generate(assessment_id=a.id, generated_by=user.id)
+    assert db_session.query(Report).filter(Report.assessment_id == a.id).count() == 2
+
+
+def test_evidence_summary_counts_by_status(db_session, make_user):
+    from models_v2 import EvidenceStatus, QuestionV2, ResponseV2
+    from question_bank_v2 import seed_question_bank_v2
+    from report_renderer import HTMLReportRenderer
+
+    user, _ = make_user(role="admin")
+    a = _scored_assessment(db_session, user)
+    seed_question_bank_v2(db_session)
+    qids = [q for (q,) in db_session.query(QuestionV2.id).order_by(QuestionV2.id).limit(4)]
+    statuses = [EvidenceStatus.ACCEPTED, EvidenceStatus.ACCEPTED,
+                EvidenceStatus.REJECTED, EvidenceStatus.NOT_REQUIRED]
+    for qid, status in zip(qids, statuses):
+        db_session.add(ResponseV2(assessment_id=a.id, question_id=qid, numeric_score=3.0,
+                                  evidence_status=status))
+    db_session.commit()
+
+    counts = {row["label"]: row["count"] for row in HTMLReportRenderer(db_session)._evidence(a.id)}
+    assert counts == {
+        "Verified (Accepted)": 2,
+        "Submitted, pending verification": 0,
+        "Awaiting evidence": 0,
+        "Rejected": 1,
+        "Evidence not required": 1,
+    }
+
+
+class _InlinePool:
+    """Stands in for the build pool: runs submissions on the calling thread."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+
+        self.submitted += 1
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as exc:  # noqa: BLE001 - handed back through the future
+            future.set_exception(exc)
+        return future
+
+
+def test_unpicklable_story_builds_in_process(monkeypatch):
+    import report_generator_v2 as rg
+    from reportlab.platypus import Paragraph
+    from reportlab.lib.styles import getSampleStyleSheet
+
+    pool = _InlinePool()
+    monkeypatch.setattr(rg, "_build_pool", lambda: pool)
+    para = Paragraph("hello", getSampleStyleSheet()["Normal"])
+    para.unpicklable = lambda: None
+    pdf = rg._render_pdf([para], "t", ("Firm", "Confidential", "example.com", "#0E6E62"))
+    assert pdf.startswith(b"%PDF")
+    assert pool.submitted == 0
+
+
+def test_build_errors_in_worker_are_not_retried(monkeypatch):
+    import report_generator_v2 as rg
+
+    pool = _InlinePool()
+    builds = []
+
+    def failing_build(story, title, furniture):
+        builds.append(title)
+        raise TypeError("layout bug")
+
+    monkeypatch.setattr(rg, "_build_pool", lambda: pool)
+    monkeypatch.setattr(rg, "_build_pdf", failing_build)
+    with pytest.raises(TypeError, match="layout bug"):
+        rg._render_pdf([], "t", ("Firm", "Confidential", "example.com", "#0E6E62"))
+    assert builds == ["t"] and pool.submitted == 1
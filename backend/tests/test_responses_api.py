@@ -0,0 +1,105 @@
+"""Response save endpoints: single upsert and one-transaction bulk save."""
+from datetime import date
+
+
+def _setup(db_session, make_user):
+    from models_v2 import AssessmentMode, AssessmentV2, QuestionV2
+    from question_bank_v2 import seed_question_bank_v2
+
+    seed_question_bank_v2(db_session)
+    owner = make_user(role="auditor")
+    a = AssessmentV2(
+        client_name="ACME Industrial",
+        site_name="Plant A",
+        assessment_mode=AssessmentMode.STANDARD,
+        assessment_date=date.today(),
+        status="in_progress",
+        creator_id=owner[0].id,
+    )
+    db_session.add(a)
+    db_session.commit()
+    qids = [q.id for q in db_session.query(QuestionV2)
+            .filter(QuestionV2.evidence_required == False)  # noqa: E712
+            .order_by(QuestionV2.id).limit(3)]
+    return owner, a.id, qids
+
+
+def test_single_save_inserts_then_updates(client, db_session, make_user, auth_headers):
+    owner, aid, qids = _setup(db_session, make_user)
+    headers = auth_headers(owner)
+    url = f"/api/v2/assessments/{aid}/responses"
+
+    first = client.post(url, json={"question_id": qids[0], "numeric_score": 3}, headers=headers)
+    assert first.status_code == 200, first.text
+    body = first.json()
+    assert body["id"] and body["numeric_score"] == 3
+    assert body["evidence_status"] == "not_required"
+
+    second = client.post(url, json={"question_id": qids[0], "numeric_score": 4,
+                                    "is_draft": True}, headers=headers)
+    assert second.json() == {**body, "numeric_score": 4, "is_draft": True}
+
+
+def test_bulk_save_reports_unknown_questions(client, db_session, make_user, auth_headers):
+    from models_v2 import ResponseV2
+
+    owner, aid, qids = _setup(db_session, make_user)
+    payload = {"responses": [{"question_id": q, "numeric_score": 2} for q in qids]
+               + [{"question_id": 999999, "numeric_score": 2}]}
+    r = client.post(f"/api/v2/assessments/{aid}/responses/bulk", json=payload,
+                    headers=auth_headers(owner))
+    assert r.status_code == 200, r.text
+    statuses = [row["status"] for row in r.json()["results"]]
+    assert statuses == ["ok", "ok", "ok", "error"]
+    assert db_session.query(ResponseV2).filter(ResponseV2.assessment_id == aid).count() == 3
+
+
+def test_bulk_save_updates_existing_and_repeated_answers(client, db_session, make_user,
+                                                         auth_headers):
+    from models_v2 import ResponseV2
+
+    owner, aid, qids = _setup(db_session, make_user)
+    headers = auth_headers(owner)
+    url = f"/api/v2/assessments/{aid}/responses"
+    assert client.post(url, json={"question_id": qids[0], "numeric_score": 1},
+                       headers=headers).status_code == 200
+
+    payload = {"responses": [
+        {"question_id": qids[0], "numeric_score": 4},  # updates the saved row
+        {"question_id": qids[1], "numeric_score": 2},
+        {"question_id": qids[1], "numeric_score": 5},  # repeated within the batch
+        {"question_id": qids[1], "numeric_score": 3, "respondent_role": "MANAGER"},
+    ]}
+    r = client.post(f"{url}/bulk", json=payload, headers=headers)
+    assert r.status_code == 200, r.text
+
+    db_session.expire_all()
+    saved = {(row.question_id, row.respondent_role and row.respondent_role.value):
+             row.numeric_score
+             for row in db_session.query(ResponseV2).filter(ResponseV2.assessment_id == aid)}
+    assert saved == {(qids[0], None): 4, (qids[1], None): 5, (qids[1], "MANAGER"): 3}
+
+
+def test_bulk_save_looks_questions_up_once(client, db_session, make_user, auth_headers):
+    from sqlalchemy import event
+
+    from models_v2 import QuestionV2
+
+    owner, aid, qids = _setup(db_session, make_user)
+    headers = auth_headers(owner)
+    db_session.expunge_all()
+
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        r = client.post(f"/api/v2/assessments/{aid}/responses/bulk", headers=headers,
+                        json={"responses": [{"question_id": q, "numeric_score": 2}
+                                            for q in qids * 4]})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert r.status_code == 200, r.text
+    question_selects = [s for s in statements
+                        if s.lstrip().startswith("SELECT") and f"FROM {QuestionV2.__tablename__}" in s]
+    assert len(question_selects) == 1
@@ -73,3 +73,25 @@ def test_quickscan_only_picks_tagged_questions(db_session):
     _seed(db_session, modes_as_string=True)
     for q in RoutingEngine(db_session)._route_quickscan():
         assert "quickscan" in [m.lower() for m in q["assessment_modes"]]
+
+
+def test_candidates_are_detached_snapshots(db_session):
+    from question_bank_v2 import QuestionDTO
+
+    _seed(db_session, modes_as_string=False)
+    sd = db_session.query(Subdomain).filter(Subdomain.code == "WC.1").one()
+    candidates = RoutingEngine(db_session)._subdomain_candidates(sd.id)
+
+    assert all(isinstance(q, QuestionDTO) for q in candidates)
+    # Best-first: the critical question leads, then descending weight.
+    assert candidates[0].is_critical
+    assert [q.weight for q in candidates[1:]] == sorted(
+        (q.weight for q in candidates[1:]), reverse=True
+    )
+
+
+def test_deepdive_role_filter(db_session):
+    _seed(db_session, modes_as_string=False)
+    eng = RoutingEngine(db_session)
+    assert len(eng._route_deepdive(TargetRoleV2.TECHNICIAN)) == N_SUBDOMAINS * QS_PER_SUBDOMAIN
+    assert eng._route_deepdive(TargetRoleV2.PLANNER) == []
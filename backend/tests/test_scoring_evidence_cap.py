@@ -140,3 +140,37 @@ class TestEvidenceCap:
         engine = ScoringEngineV2(db_session)
         subdomain_result = engine._score_subdomain(a.id, sd, a.assessment_mode)
         assert subdomain_result["final_score"] == 5.0
+
+    def test_weighted_score_mixes_roles_grades_and_unscored_rows(self, db_session, make_user):
+        from models_v2 import DomainType, EvidenceStatus, QuestionV2, ResponseV2, TargetRoleV2
+        from scoring_engine_v2 import ScoringEngineV2
+
+        user, _ = make_user()
+        a = _make_assessment(db_session, creator_id=user.id)
+        _dom, sd, q1 = _make_domain_subdomain_question(db_session, evidence_required=True)
+        q1.weight = 2.0
+        q2 = QuestionV2(subdomain_id=sd.id, question_code="WC.1-02", question_text="?",
+                        question_type="likert", domain=DomainType.WC,
+                        target_role=TargetRoleV2.SUPERVISOR, weight=1.0,
+                        scoring_rubric={"1": "no", "5": "yes"}, is_critical=False,
+                        evidence_required=False, is_active=True)
+        db_session.add(q2)
+        db_session.flush()
+        for qid, score, role, grade, status in [
+            (q1.id, 5.0, TargetRoleV2.TECHNICIAN, None, EvidenceStatus.PENDING_VERIFICATION),
+            (q2.id, 4.0, TargetRoleV2.SUPERVISOR, "B", EvidenceStatus.NOT_REQUIRED),
+            (q2.id, None, TargetRoleV2.MANAGER, None, None),
+        ]:
+            db_session.add(ResponseV2(assessment_id=a.id, question_id=qid, numeric_score=score,
+                                      respondent_role=role, evidence_grade=grade,
+                                      evidence_status=status, is_draft=False, is_na=False))
+        db_session.commit()
+
+        result = ScoringEngineV2(db_session)._score_subdomain(a.id, sd, a.assessment_mode)
+        # (3.0 capped × 0.35 × 2.0) + (4.0 × 0.20 × 1.0 × 0.95) over weights 0.70 + 0.20
+        assert result["final_score"] == 3.18
+        assert result["response_count"] == 3
+        assert result["evidence_blocked_questions"] == [{
+            "question_id": q1.id, "code": "WC.1-01", "claimed": 5.0, "capped_to": 3.0,
+            "evidence_status": "pending_verification",
+        }]
@@ -0,0 +1,42 @@
+"""Persisting a scoring run replaces the assessment's subdomain score rows."""
+from datetime import date
+
+
+def test_calculate_persists_one_row_per_subdomain(db_session, make_user):
+    from models_v2 import (
+        AssessmentMode, AssessmentV2, Domain, DomainType, QuestionV2, ResponseV2,
+        Subdomain, SubdomainScore, TargetRoleV2,
+    )
+    from scoring_engine_v2 import ScoringEngineV2
+
+    user, _ = make_user()
+    a = AssessmentV2(client_name="X", site_name="Y", assessment_mode=AssessmentMode.STANDARD,
+                     assessment_date=date.today(), status="in_progress", creator_id=user.id)
+    db_session.add(a); db_session.flush()
+    dom = Domain(code="SG", name="Strategy & Governance", description="", display_order=1)
+    db_session.add(dom); db_session.flush()
+    for n in (1, 2):
+        db_session.add(Subdomain(domain_id=dom.id, code=f"SG.{n}", name="s", display_order=n))
+    db_session.flush()
+    sd1 = db_session.query(Subdomain).filter(Subdomain.code == "SG.1").one()
+    q = QuestionV2(subdomain_id=sd1.id, question_code="SG.1-02", question_text="?",
+                   question_type="likert", domain=DomainType.SG,
+                   target_role=TargetRoleV2.MANAGER, weight=1.0, scoring_rubric={"1": "a"},
+                   is_critical=False, evidence_required=False, is_active=True)
+    db_session.add(q); db_session.flush()
+    db_session.add(ResponseV2(assessment_id=a.id, question_id=q.id, numeric_score=3.0,
+                              respondent_role=TargetRoleV2.MANAGER, is_draft=False, is_na=False))
+    db_session.commit()
+
+    engine = ScoringEngineV2(db_session)
+    engine.calculate(a.id)
+    engine.calculate(a.id)  # re-scoring replaces, never accumulates
+
+    rows = {r.subdomain_id: r for r in
+            db_session.query(SubdomainScore).filter(SubdomainScore.assessment_id == a.id)}
+    assert len(rows) == 2
+    assert rows[sd1.id].final_score == 3.0
+    assert rows[sd1.id].created_at is not None
+    db_session.refresh(a)
+    assert a.overall_rmi == 3.0
+    assert a.maturity_level == "Level 3 - Systematic"
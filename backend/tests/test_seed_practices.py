@@ -0,0 +1,19 @@
+"""Practice library seeder."""
+
+
+def test_seed_practices_inserts_library_once(db_session):
+    from models_v2 import Practice
+    from question_bank_v2 import seed_domains_and_subdomains
+    from seed_practices import PRACTICES, seed_practices
+
+    seed_domains_and_subdomains(db_session)
+    expected = sum(len(p) for p in PRACTICES.values())
+    assert seed_practices(db_session) == expected
+    assert seed_practices(db_session) == 0  # idempotent re-run
+    assert db_session.query(Practice).count() == expected
+
+    p = db_session.query(Practice).filter(Practice.practice_id == "WC.1-1to2").one()
+    assert p.practice_code == "WC.1-12-P"
+    assert isinstance(p.tools, list) and isinstance(p.success_metrics, list)
+    assert p.pathways == {"1_to_2": {"focus": p.title, "timeline": p.timeline}}
+    assert p.created_at is not None and p.version == "2.0"